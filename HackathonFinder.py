@@ -7,7 +7,7 @@
 # ------------------------------
 # Cell 1 - Install dependencies
 # ------------------------------
-get_ipython().system('pip install -q selenium pandas webdriver-manager')
+get_ipython().system('pip install -q selenium pandas webdriver-manager requests lxml cssselect aiohttp psutil pyarrow')
 
 
 # In[2]:
@@ -49,6 +49,26 @@ def safe_click(driver, by, val):
 # ------------------------------
 # Cell 3 - Driver factory
 # ------------------------------
+import shutil
+import threading
+
+# resolve the chromedriver binary once per session; ChromeDriverManager().install()
+# checks versions / downloads on every call, which dominated browser start time.
+# A chromedriver already on PATH (CI images, the distro's chromium-driver) is
+# used as is, so browsers also start without internet access
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+def get_chromedriver_path():
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = shutil.which("chromedriver") or ChromeDriverManager().install()
+        return _chromedriver_path
+
+# set by the benchmark: keep Chrome's network log so bytes transferred can be counted
+CAPTURE_NETWORK_LOG = False
+
 def get_driver(headless=True):
     options = webdriver.ChromeOptions()
     if headless:
@@ -56,98 +76,1686 @@ def get_driver(headless=True):
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
-    # optional: speed up by disabling images (uncomment if desired)
-    # prefs = {"profile.managed_default_content_settings.images": 2}
-    # options.add_experimental_option("prefs", prefs)
+    # images, media, fonts and trackers are blocked per source by the browser
+    # profiles (Cell 3l) instead of a profile-wide pref
+    if CAPTURE_NETWORK_LOG:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
     # instantiate driver (webdriver-manager auto-downloads compatible chromedriver)
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
     driver.set_page_load_timeout(30)
     return driver
 
 
-# In[4]:
+# In[ ]:
 
 
 # ------------------------------
-# Cell 4 - Scraper: Devpost (pagination)
+# Cell 3a - Driver pool (warm, reusable browsers)
 # ------------------------------
-def scrape_devpost(max_pages=10, pause=3):
-    results = []
-    driver = get_driver(headless=True)
+from contextlib import contextmanager, nullcontext
+
+# wipe everything a scraper may have left behind so the next one starts clean
+def reset_driver(driver):
+    handles = driver.window_handles
+    for h in handles[1:]:
+        driver.switch_to.window(h)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass  # about:blank and some origins don't expose storage
     try:
-        base = "https://devpost.com/hackathons"
-        driver.get(base)
-        time.sleep(pause)
-        page = 1
+        # delete_all_cookies() only clears the current domain
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except WebDriverException:
+        driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+class DriverPool:
+    # keeps up to `size` Chrome sessions alive and lends them to the scrapers;
+    # a "hit" is a request served by an idle browser, a "miss" needs a cold start
+    def __init__(self, size=2, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"hits": 0, "misses": 0, "started": 0, "discarded": 0, "startup_seconds": 0.0}
+
+    def _start(self):
+        t0 = time.perf_counter()
+        with METRICS.stage("driver_start", "pool"):
+            driver = get_driver(headless=self.headless)
+        elapsed = time.perf_counter() - t0
+        with self._cond:
+            self._stats["started"] += 1
+            self._stats["startup_seconds"] += elapsed
+        print(f"[DriverPool] browser started in {elapsed:.1f}s")
+        return driver
+
+    def _reserve(self):
+        # caller holds the lock; claims a slot for a new browser
+        if self._total < self.size:
+            self._total += 1
+            return True
+        return False
+
+    def _unreserve(self):
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def warm(self, n=None):
+        # start browsers ahead of time so the first scrapers don't pay for it
+        n = self.size if n is None else min(n, self.size)
         while True:
-            print(f"[Devpost] scraping page {page} ...")
-            time.sleep(1)
-            # try several card selectors (page HTML varies)
-            cards = driver.find_elements(By.CSS_SELECTOR, ".hackathon-tile") \
-                    or driver.find_elements(By.CSS_SELECTOR, ".challenge-card") \
-                    or driver.find_elements(By.CSS_SELECTOR, ".project-card")  # fallback
-            if not cards:
-                print("[Devpost] no cards found on this page (selector may have changed).")
-            for c in cards:
-                try:
-                    title = safe_text(c.find_element(By.TAG_NAME, "h3")) if c else "N/A"
-                except:
-                    title = "N/A"
-                try:
-                    link = c.find_element(By.TAG_NAME, "a").get_attribute("href")
-                except:
-                    link = "N/A"
-                # try different date/location selectors
-                date = "N/A"
-                location = "N/A"
-                try:
-                    date = safe_text(c.find_element(By.CSS_SELECTOR, ".submission-period"))
-                except:
-                    try:
-                        date = safe_text(c.find_element(By.CSS_SELECTOR, ".dates"))
-                    except:
-                        pass
-                try:
-                    location = safe_text(c.find_element(By.CSS_SELECTOR, ".challenge-location"))
-                except:
-                    try:
-                        location = safe_text(c.find_element(By.CSS_SELECTOR, ".location"))
-                    except:
-                        pass
-
-                results.append({
-                    "Source": "Devpost",
-                    "Title": title,
-                    "Date": date,
-                    "Location": location,
-                    "Link": link,
-                    "ScrapedAt": datetime.utcnow().isoformat()
-                })
-
-            # next page attempt: Devpost uses "Next" link text or page param
-            page += 1
-            if page > max_pages:
-                break
-            # try clicking "Next" links
+            with self._cond:
+                if self._total >= n or not self._reserve():
+                    break
             try:
-                # many Devpost pages use anchor with rel=next or a next button with text
-                next_btn = driver.find_element(By.LINK_TEXT, "Next »")
-                next_btn.click()
-                time.sleep(pause)
-            except:
-                # fallback: try to navigate by adding ?page=X
-                try:
-                    driver.get(f"{base}?page={page}")
-                    time.sleep(pause)
-                except:
+                driver = self._start()
+            except Exception:
+                self._unreserve()
+                raise
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+
+    def acquire(self, timeout=None):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("driver pool is closed")
+            while True:
+                if self._idle:
+                    self._stats["hits"] += 1
+                    return self._idle.pop()
+                if self._reserve():
+                    self._stats["misses"] += 1
+                    break
+                if not self._cond.wait(timeout):
+                    raise TimeoutError("no browser available in the driver pool")
+        try:
+            return self._start()
+        except Exception:
+            self._unreserve()
+            raise
+
+    def release(self, driver):
+        if self._closed:
+            self.discard(driver)
+            return
+        try:
+            reset_driver(driver)
+        except Exception:
+            # crashed / unresponsive browser: don't hand it to the next scraper
+            self.discard(driver)
+            return
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._stats["discarded"] += 1
+        self._unreserve()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        driver = self.acquire(timeout)
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                self.release(driver)
+            else:
+                self.discard(driver)
+
+    def stats(self):
+        with self._cond:
+            s = dict(self._stats)
+            s["live"] = self._total
+            s["idle"] = len(self._idle)
+        requests = s["hits"] + s["misses"]
+        s["hit_rate"] = s["hits"] / requests if requests else 0.0
+        s["avg_startup_seconds"] = s["startup_seconds"] / s["started"] if s["started"] else 0.0
+        return s
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self.discard(driver)
+
+
+def make_driver_pool(size=None):
+    return DriverPool(size=size or 2, headless=True)
+
+DRIVER_POOL = make_driver_pool()
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3b - Page readiness (wait for content instead of sleeping)
+# ------------------------------
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# per-source readiness rule: wait until a card selector matches, or (no selector)
+# until the page's network activity goes quiet; timeouts are in seconds
+READINESS = {
+    "Devpost": {"selector": ".hackathon-tile, .challenge-card, .project-card", "timeout": 15},
+    "MLH": {"selector": ".event-wrapper", "timeout": 10},
+    "Hackathon.com": {"selector": ".event-item", "timeout": 12},
+    "Eventbrite": {"selector": "div[data-testid='event-card']", "timeout": 15},
+    "AngelHack": {"selector": ".elementor-post, .elementor-widget-container, .event", "timeout": 10},
+}
+NETWORK_IDLE_MS = 500  # no new resource requests for this long counts as idle
+
+# every wait is logged here so the timeouts can be tuned from real runs
+READINESS_LOG = []
+_readiness_lock = threading.Lock()
+
+def wait_for_network_idle(driver, timeout, idle_ms=NETWORK_IDLE_MS):
+    deadline = time.monotonic() + timeout
+    last_count, stable_since = -1, time.monotonic()
+    while time.monotonic() < deadline:
+        state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];")
+        now = time.monotonic()
+        if state != "complete" or count != last_count:
+            last_count, stable_since = count, now
+        elif (now - stable_since) * 1000 >= idle_ms:
+            return True
+        time.sleep(0.1)
+    return False
+
+# blocks until the page for `source` has content (or the timeout hits) and returns
+# whether it became ready
+def wait_until_ready(driver, source, selector=None, timeout=None):
+    rule = READINESS.get(source, {})
+    selector = selector or rule.get("selector")
+    timeout = source_guard(source).cap(timeout or rule.get("timeout", 10))
+    t0 = time.perf_counter()
+    ready = True
+    try:
+        if selector:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+    except TimeoutException:
+        ready = False
+    if ready and not selector:
+        ready = wait_for_network_idle(driver, timeout)
+    elapsed = time.perf_counter() - t0
+    with _readiness_lock:
+        READINESS_LOG.append({
+            "source": source,
+            "mode": "selector" if selector else "network_idle",
+            "ready": ready,
+            "seconds": round(elapsed, 3),
+            "timeout": timeout,
+        })
+    if not ready:
+        print(f"[{source}] page not ready after {timeout}s")
+    return ready
+
+# summary of READINESS_LOG per source; suggested_timeout is 1.5x the observed p95
+def readiness_stats():
+    with _readiness_lock:
+        log = list(READINESS_LOG)
+    stats = {}
+    for source in sorted({e["source"] for e in log}):
+        ok = sorted(e["seconds"] for e in log if e["source"] == source and e["ready"])
+        waits = [e for e in log if e["source"] == source]
+        s = {"waits": len(waits), "timeouts": len(waits) - len(ok)}
+        if ok:
+            s["p50"] = ok[len(ok) // 2]
+            s["p95"] = ok[min(len(ok) - 1, int(len(ok) * 0.95))]
+            s["max"] = ok[-1]
+            s["suggested_timeout"] = max(2, round(s["p95"] * 1.5, 1))
+        stats[source] = s
+    return stats
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3c - Bulk card extraction (one execute_script round trip per page)
+# ------------------------------
+# listing page of each source (the benchmark in Cell 11 points these at a local server)
+SOURCE_URLS = {
+    "Devpost": "https://devpost.com/hackathons",
+    "MLH": "https://mlh.io/seasons/2025/events",  # Adjust season if needed
+    "Hackathon.com": "https://www.hackathon.com/city/online",
+    "Eventbrite": "https://www.eventbrite.com/d/online/hackathon/",
+    "AngelHack": "https://angelhack.com/events/",
+}
+
+# declarative field map per source:
+#   cards    - card selectors, tried in order until one matches
+#   fields   - css: selectors tried in order inside the card (first match wins)
+#              attr: read this attribute/property instead of the visible text
+#              self: fall back to the whole card's text
+#              required: drop the card when nothing matches (otherwise "N/A")
+FIELD_MAPS = {
+    "Devpost": {
+        "cards": [".hackathon-tile", ".challenge-card", ".project-card"],
+        "fields": {
+            "Title": {"css": ["h3"]},
+            "Link": {"css": ["a"], "attr": "href"},
+            "Date": {"css": [".submission-period", ".dates"]},
+            "Location": {"css": [".challenge-location", ".location"]},
+        },
+    },
+    "MLH": {
+        "cards": [".event-wrapper"],
+        "fields": {
+            "Title": {"css": ["h3"], "required": True},
+            "Date": {"css": [".event-date"], "required": True},
+            "Location": {"css": [".event-location"], "required": True},
+            "Link": {"css": ["a"], "attr": "href", "required": True},
+        },
+    },
+    "Hackathon.com": {
+        "cards": [".event-item"],
+        "fields": {
+            "Title": {"css": [".event-title"], "required": True},
+            "Date": {"css": [".event-date"], "required": True},
+            "Location": {"css": [".event-location"], "required": True},
+            "Link": {"css": ["a"], "attr": "href", "required": True},
+        },
+    },
+    "Eventbrite": {
+        "cards": ["div[data-testid='event-card']"],
+        "fields": {
+            "Title": {"css": ["div.eds-event-card__formatted-name--is-clamped"], "required": True},
+            "Date": {"css": ["div.eds-event-card-content__sub-title"], "required": True},
+            "Link": {"css": ["a"], "attr": "href", "required": True},
+        },
+    },
+    "AngelHack": {
+        "cards": [".elementor-post", ".elementor-widget-container", ".event"],
+        "fields": {
+            "Title": {"css": ["h3", "h2"], "self": True},
+            "Link": {"css": ["a"], "attr": "href"},
+        },
+    },
+}
+
+# runs in the page; returns every card's fields in a single WebDriver call
+_EXTRACT_CARDS_JS = """
+const spec = arguments[0];
+const text = el => (el.innerText || el.textContent || "").trim();
+let cards = [], used = null;
+for (const sel of spec.cards) {
+    cards = document.querySelectorAll(sel);
+    if (cards.length) { used = sel; break; }
+}
+const rows = [];
+for (const card of cards) {
+    const row = {};
+    for (const [name, f] of Object.entries(spec.fields)) {
+        let val = null;
+        for (const sel of f.css) {
+            const el = card.querySelector(sel);
+            if (el) {
+                val = f.attr ? (el[f.attr] ?? el.getAttribute(f.attr)) : text(el);
+                break;
+            }
+        }
+        if (val === null && f.self) val = text(card);
+        row[name] = val;
+    }
+    rows.push(row);
+}
+return {selector: used, cards: rows};
+"""
+
+# applies the required/default rules of the field map to raw extracted rows
+def finish_cards(source, rows):
+    with METRICS.stage("page_card_parse", source) as m:
+        cards = _finish_cards(source, rows)
+        m["items"] = len(cards)
+    return cards
+
+def _finish_cards(source, rows):
+    fields = FIELD_MAPS[source]["fields"]
+    cards = []
+    for row in rows:
+        if any(f.get("required") and row.get(name) is None for name, f in fields.items()):
+            continue
+        card = {}
+        for name, f in fields.items():
+            val = row.get(name)
+            if val is None or (val == "" and not f.get("required")):
+                val = "N/A"
+            card[name] = val
+        cards.append(card)
+    return cards
+
+# returns (cards, info) where info has the card selector that matched
+def extract_cards(driver, source):
+    spec = learned_spec(source)
+    with METRICS.stage("extraction", source):
+        out = driver.execute_script(_EXTRACT_CARDS_JS, spec) or {}
+        cards = finish_cards(source, out.get("cards") or [])
+    SELECTOR_CACHE.learn(source, spec["cards"], out.get("selector"))
+    return cards, {"selector": out.get("selector")}
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3d - HTTP-first fetching (plain HTTP + lxml, browser only as fallback)
+# ------------------------------
+import requests
+import lxml.etree
+import lxml.html
+import psutil
+from requests.adapters import HTTPAdapter
+
+HTTP_TIMEOUT = 15
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# sources to try without a browser first; a page whose static HTML has no cards
+# (client-rendered listing) falls back to Selenium automatically
+HTTP_FIRST = {
+    "Devpost": True,
+    "MLH": True,
+    "Hackathon.com": True,
+    "Eventbrite": True,
+    "AngelHack": True,
+}
+
+def make_http_session(pool_size=10):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+HTTP_SESSION = make_http_session()
+
+# goes through the page cache (Cell 3g)
+def fetch_html(url, source):
+    body, entry = cache_lookup(source, url)
+    if body is not None:
+        return body
+    SCHEDULER.acquire(source)
+    with METRICS.stage("page_load", source):
+        resp = HTTP_SESSION.get(url, timeout=source_guard(source).cap(HTTP_TIMEOUT),
+                                headers=PAGE_CACHE.validators(entry))
+    SCHEDULER.report(source, resp.status_code, retry_after=retry_after_seconds(resp.headers))
+    if resp.status_code != 304:
+        resp.raise_for_status()
+    return cache_response(source, url, entry, resp.status_code, resp.text, resp.headers)
+
+# lxml document, or None when the body is empty or can't be parsed as HTML
+def parse_html(html):
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return None
+
+# visible-ish text of an lxml node, whitespace collapsed like the browser's innerText
+def node_text(el):
+    return " ".join(el.text_content().split())
+
+# lxml counterpart of _EXTRACT_CARDS_JS: same FIELD_MAPS, same result shape
+def extract_cards_from_html(html, source, base_url):
+    with METRICS.stage("extraction", source):
+        return _extract_cards_from_html(html, source, base_url)
+
+def _extract_cards_from_html(html, source, base_url):
+    spec = learned_spec(source)
+    doc = parse_html(html)
+    if doc is None:  # empty or not HTML: a page without cards
+        return [], {"selector": None}
+    doc.make_links_absolute(base_url, resolve_base_href=True)
+    cards, used = [], None
+    for sel in spec["cards"]:
+        cards = doc.cssselect(sel)
+        if cards:
+            used = sel
+            break
+    rows = []
+    for card in cards:
+        row = {}
+        for name, f in spec["fields"].items():
+            val = None
+            for sel in f["css"]:
+                found = card.cssselect(sel)
+                if found:
+                    val = found[0].get(f["attr"], "") if f.get("attr") else node_text(found[0])
                     break
-    except WebDriverException as e:
-        print("Devpost scraping driver error:", e)
+            if val is None and f.get("self"):
+                val = node_text(card)
+            row[name] = val
+        rows.append(row)
+    SELECTOR_CACHE.learn(source, spec["cards"], used)
+    return finish_cards(source, rows), {"selector": used}
+
+
+# long crawls slowly grow Chrome's memory: a pooled browser is swapped for a
+# fresh one after this many pages, or once its process tree passes the RSS limit
+RECYCLE_AFTER_PAGES = 25
+RECYCLE_RSS_MB = 1500
+
+# RSS of a driver's chromedriver process and everything it started (Chrome)
+def driver_rss_mb(driver):
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        total = proc.memory_info().rss
+        for child in proc.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / 2**20
+    except (AttributeError, psutil.Error):
+        return 0.0
+
+class DriverLease:
+    # hands a scraper a pooled browser only once a page actually needs one;
+    # an explicitly passed driver is used as-is and never returned to the pool.
+    # A pooled browser is recycled when worn out (see above), and reconnect()
+    # swaps a crashed one for a fresh one, so the scraper never notices
+    def __init__(self, driver=None):
+        self._driver = driver
+        self._borrowed = None
+        self._pool = None
+        self._pages = 0
+
+    def _worn_out(self):
+        if self._pages >= RECYCLE_AFTER_PAGES:
+            return f"{self._pages} pages"
+        rss = driver_rss_mb(self._borrowed)
+        if rss > RECYCLE_RSS_MB:
+            return f"{rss:.0f} MB RSS"
+        return None
+
+    def _drop(self):
+        self._pool.discard(self._borrowed)
+        self._borrowed = self._driver = None
+
+    def get(self):
+        if self._borrowed is not None:
+            reason = self._worn_out()
+            if reason:
+                print(f"[DriverLease] recycling browser after {reason}")
+                self._drop()
+        if self._driver is None:
+            self._pool = DRIVER_POOL
+            self._borrowed = self._driver = self._pool.acquire()
+            self._pages = 0
+        self._pages += 1
+        return self._driver
+
+    # False when the driver was passed in and can't be replaced
+    def reconnect(self):
+        if self._borrowed is None:
+            return False
+        self._drop()
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._borrowed is not None:
+            if isinstance(exc, WebDriverException):
+                self._pool.discard(self._borrowed)
+            else:
+                self._pool.release(self._borrowed)
+            self._borrowed = self._driver = None
+        return False
+
+# one listing page -> cards; static HTML first, then the browser path.
+# expect_cards marks a page that should have cards (page 1), so an empty result
+# there is treated as a broken load rather than the end of the listing
+def fetch_cards(url, source, lease, timeout=None, expect_cards=False):
+    if HTTP_FIRST.get(source):
+        try:
+            cards, info = extract_cards_from_html(fetch_html(url, source), source, url)
+            if cards:
+                info["via"] = "http"
+                return cards, info
+        except (requests.RequestException, CacheMiss) as e:
+            print(f"[{source}] HTTP fetch failed ({e}), falling back to the browser")
+    return fetch_cards_browser(url, source, lease, timeout=timeout, expect_cards=expect_cards)
+
+# rendered pages are cached too, so a fresh copy (or replay mode) skips Chrome
+def fetch_cards_browser(url, source, lease, timeout=None, expect_cards=False):
+    if CACHE_MODE != "off":
+        entry = PAGE_CACHE.lookup(source, url, kind="rendered")
+        if entry is not None and (CACHE_MODE == "replay" or PAGE_CACHE.is_fresh(entry)):
+            cards, info = extract_cards_from_html(PAGE_CACHE.read_body(entry), source, url)
+            info["via"] = "cache"
+            return cards, info
+        if CACHE_MODE == "replay":
+            print(f"[{source}] {url} is not in the page cache")
+            return [], {"selector": None, "via": "cache"}
+    profile, fell_back = source_profile(source), False
+    while True:
+        cards, info, driver = render_cards(url, source, lease, profile, timeout=timeout)
+        profile = info["profile"]
+        fallback = PROFILE_FALLBACK.get(profile)
+        if cards or info.get("timed_out") or fallback is None or not empty_is_anomalous(info, expect_cards):
+            break
+        # cards were expected: the blocked requests may have broken the page
+        print(f"[{source}] no cards with the {profile} browser profile, trying {fallback}")
+        profile, fell_back = fallback, True
+    if cards and fell_back:
+        demote_profile(source, profile)
+    info["via"] = "browser"
+    # a block page looks like an empty one; the normal last page must not back off
+    SCHEDULER.report(source, empty=not cards and empty_is_anomalous(info, expect_cards))
+    if cards and CACHE_MODE == "on":
+        PAGE_CACHE.store(source, url, driver.page_source, kind="rendered")
+    return cards, info
+
+# an empty page past the last one is how every listing ends; it only points at
+# a broken (or throttled) load when cards were expected, or the page timed out
+# or never became ready
+def empty_is_anomalous(info, expect_cards):
+    return expect_cards or info.get("timed_out", False) or not info.get("ready", True)
+
+# loads one page in the lease's browser under a request-blocking profile;
+# a browser that dies mid-page is replaced and the page tried once more
+def render_cards(url, source, lease, profile, timeout=None):
+    for attempt in (1, 2):
+        driver = lease.get()
+        try:
+            profile = use_profile(driver, profile)
+            if CAPTURE_NETWORK_LOG:
+                driver.get_log("performance")  # drop entries from earlier pages
+            SCHEDULER.acquire(source)
+            with METRICS.stage("page_load", source):
+                try:
+                    driver.get(url)
+                except TimeoutException:
+                    # set_page_load_timeout fired: count it as a failed page, not a crash
+                    print(f"[{source}] page load timed out: {url}")
+                    return [], {"selector": None, "timed_out": True, "profile": profile}, driver
+            with METRICS.stage("readiness_wait", source):
+                ready = wait_until_ready(driver, source, timeout=timeout)
+            cards, info = extract_cards(driver, source)
+            info["profile"] = profile
+            info["ready"] = ready
+            if CAPTURE_NETWORK_LOG:
+                info["transfer"] = page_transfer(driver)
+            return cards, info, driver
+        except WebDriverException as e:
+            if attempt == 2 or not lease.reconnect():
+                raise
+            print(f"[{source}] browser lost ({type(e).__name__}), reconnecting")
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3e - Async pagination crawler
+# ------------------------------
+import asyncio
+import queue
+import aiohttp
+
+CRAWL_CONCURRENCY = 4  # listing pages in flight per source
+
+# fetches all (page, url) pairs over one aiohttp session and yields
+# (page, url, cards, info) as each page finishes parsing, in completion order
+async def crawl_pages_async(pages, source, concurrency=CRAWL_CONCURRENCY):
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=source_guard(source).cap(HTTP_TIMEOUT))
+    async with aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS, timeout=timeout) as session:
+        async def one(page, url):
+            try:
+                html, entry = cache_lookup(source, url)
+                if html is None:
+                    await SCHEDULER.acquire_async(source)
+                    with METRICS.stage("page_load", source):
+                        async with session.get(url, headers=PAGE_CACHE.validators(entry)) as resp:
+                            SCHEDULER.report(source, resp.status, retry_after=retry_after_seconds(resp.headers))
+                            if resp.status != 304:
+                                resp.raise_for_status()
+                            body = await resp.text()
+                    html = cache_response(source, url, entry, resp.status, body, resp.headers)
+                cards, info = extract_cards_from_html(html, source, url)
+            except (aiohttp.ClientError, asyncio.TimeoutError, CacheMiss, UnicodeDecodeError) as e:
+                print(f"[{source}] HTTP fetch failed for page {page} ({e!r})")
+                cards, info = [], {"selector": None}
+            info["via"] = "http"
+            return page, url, cards, info
+
+        tasks = [asyncio.ensure_future(one(page, url)) for page, url in pages]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            for t in tasks:
+                t.cancel()
+
+# sync wrapper for the scrapers: runs the crawl on a private event loop in a
+# background thread (so it also works inside Jupyter's running loop) and yields
+# pages as they arrive; pages without static cards go through the browser path.
+# Closing the generator early cancels the outstanding requests.
+def crawl_pages(pages, source, lease, concurrency=CRAWL_CONCURRENCY, timeout=None):
+    pages = list(pages)
+    if not HTTP_FIRST.get(source):
+        for page, url in pages:
+            cards, info = fetch_cards_browser(url, source, lease, timeout=timeout, expect_cards=page == 1)
+            yield page, url, cards, info
+        return
+
+    out = queue.Queue()
+    done = object()
+
+    async def pump():
+        async for item in crawl_pages_async(pages, source, concurrency):
+            out.put(item)
+
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(pump())
+
+    def runner():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            out.put(e)
+        finally:
+            loop.close()
+            out.put(done)
+
+    threading.Thread(target=runner, name=f"crawl-{source}", daemon=True).start()
+    try:
+        while True:
+            item = out.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            page, url, cards, info = item
+            if not cards:
+                cards, info = fetch_cards_browser(url, source, lease, timeout=timeout, expect_cards=page == 1)
+            yield page, url, cards, info
     finally:
-        driver.quit()
-    print(f"[Devpost] done, found {len(results)} items")
-    return results
+        try:
+            loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            pass  # loop already finished
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3f - Pagination stop rules & incremental (seen-link) crawling
+# ------------------------------
+import os
+import json
+import hashlib
+
+SCRAPE_STATE_DIR = "scrape_state"  # crawl state that survives between runs
+
+# writes JSON via a temp file so a crash never leaves a half-written state file
+def save_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+def load_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+def card_fingerprint(card):
+    return hashlib.sha1(json.dumps(card, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class SeenLinks:
+    # per source: Link -> fingerprint of the card as it was last emitted
+    def __init__(self, path=os.path.join(SCRAPE_STATE_DIR, "seen_links.json")):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = load_json(path, {})
+
+    def status(self, source, card):
+        with self._lock:
+            known = self._data.get(source, {}).get(card.get("Link"))
+        if known is None:
+            return "new"
+        return "known" if known == card_fingerprint(card) else "changed"
+
+    def mark(self, source, card):
+        with self._lock:
+            self._data.setdefault(source, {})[card.get("Link")] = card_fingerprint(card)
+
+    def save(self):
+        with self._lock:
+            data = json.loads(json.dumps(self._data))
+        save_json_atomic(self.path, data)
+
+SEEN_LINKS = SeenLinks()
+
+CHECKPOINT_MAX_AGE = 24 * 3600  # older checkpoints are ignored: the listings have moved on
+
+class CrawlCheckpoints:
+    # per source: the next listing page to crawl. Saved after every page the
+    # scraper has finished with and cleared when the source completes, so a
+    # crashed or killed run picks up where it stopped
+    def __init__(self, path=os.path.join(SCRAPE_STATE_DIR, "checkpoints.json")):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = load_json(path, {})
+
+    def _live(self, entry):
+        age = (datetime.utcnow() - datetime.fromisoformat(entry["at"])).total_seconds()
+        return age < CHECKPOINT_MAX_AGE
+
+    def next_page(self, source):
+        with self._lock:
+            entry = self._data.get(source)
+        return entry["next_page"] if entry and self._live(entry) else None
+
+    def advance(self, source, page):
+        with self._lock:
+            self._data[source] = {"next_page": page + 1, "at": datetime.utcnow().isoformat()}
+            data = dict(self._data)
+        save_json_atomic(self.path, data)
+
+    def finish(self, source):
+        with self._lock:
+            if self._data.pop(source, None) is None:
+                return
+            data = dict(self._data)
+        save_json_atomic(self.path, data)
+
+    # sources with an interrupted crawl
+    def pending(self):
+        with self._lock:
+            return sorted(source for source, entry in self._data.items() if self._live(entry))
+
+CHECKPOINTS = CrawlCheckpoints()
+
+# page-ordered view over crawl_pages() that decides where pagination stops:
+#   - a page without cards ends the crawl (later pages won't have any either)
+#   - incremental: only new/changed cards are emitted, and a page with nothing
+#     new ends the crawl; cards are marked seen after the caller has handled them
+# incremental crawls fetch one page at a time by default, so a routine refresh
+# costs one or two page loads. Each page the caller has finished with is
+# checkpointed; an interrupted crawl resumes after the last checkpointed page
+def paginate(pages, source, lease, incremental=False, concurrency=None, timeout=None):
+    pages = list(pages)
+    resume = CHECKPOINTS.next_page(source)
+    if resume is not None:
+        print(f"[{source}] resuming an interrupted crawl at page {resume}")
+        pages = [(page, url) for page, url in pages if page >= resume]
+    if concurrency is None:
+        concurrency = 1 if incremental else CRAWL_CONCURRENCY
+    order = [page for page, _ in pages]
+    pending, idx = {}, 0
+    guard = source_guard(source)
+    if not guard.allow():
+        print(f"[{source}] skipped ({guard.outcome})")
+        return
+    crawl = crawl_pages(pages, source, lease, concurrency=concurrency, timeout=timeout)
+    finished = False  # ran to a stop rule: nothing left to resume
+    try:
+        for page, url, cards, info in crawl:
+            pending[page] = (url, cards, info)
+            while idx < len(order) and order[idx] in pending:
+                page = order[idx]
+                idx += 1
+                url, cards, info = pending.pop(page)
+                # the empty page past the last one is not a failure
+                guard.record(bool(cards) or not empty_is_anomalous(info, page == 1))
+                if not guard.allow():
+                    # breaker open / budget spent: keep the checkpoint for the next run
+                    print(f"[{source}] stopping at page {page} ({guard.outcome})")
+                    return
+                if not cards:
+                    print(f"[{source}] page {page} has no cards, stopping pagination")
+                    finished = True
+                    return
+                if not incremental:
+                    yield page, url, cards, info
+                    CHECKPOINTS.advance(source, page)
+                    continue
+                fresh = [c for c in cards if SEEN_LINKS.status(source, c) != "known"]
+                yield page, url, fresh, info
+                for c in fresh:
+                    SEEN_LINKS.mark(source, c)
+                CHECKPOINTS.advance(source, page)
+                if not fresh:
+                    print(f"[{source}] page {page} has only known events, stopping pagination")
+                    finished = True
+                    return
+        finished = True
+    finally:
+        crawl.close()
+        if finished:
+            CHECKPOINTS.finish(source)
+        if incremental:
+            SEEN_LINKS.save()
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3g - On-disk page cache (TTL, conditional revalidation, replay)
+# ------------------------------
+# fresh entries are served without a request; stale ones are revalidated with
+# ETag / Last-Modified; CACHE_MODE:
+#   "on"     - normal: use and fill the cache
+#   "off"    - always hit the network, store nothing
+#   "replay" - serve only from the cache and never touch the network, so Cell 9
+#              onwards can be re-run from the pages of an earlier crawl
+CACHE_MODE = "on"
+CACHE_DIR = os.path.join(SCRAPE_STATE_DIR, "page_cache")
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+CACHE_TTL = {  # seconds
+    "Devpost": 30 * 60,
+    "MLH": 6 * 3600,
+    "Hackathon.com": 3600,
+    "Eventbrite": 3600,
+    "AngelHack": 12 * 3600,
+}
+CACHE_DEFAULT_TTL = 3600
+
+
+class CacheMiss(Exception):
+    pass
+
+
+class PageCache:
+    # entries/<sha256(kind|source|url)>.json holds the metadata, the page itself
+    # is stored content-addressed in bodies/<sha256(body)>.html, so identical
+    # pages are kept once. An entry file's mtime is its last use (for LRU).
+    # _refs counts the entries pointing at each body; a body nothing points at
+    # is deleted (on replace, eviction and startup)
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+        os.makedirs(os.path.join(root, "entries"), exist_ok=True)
+        os.makedirs(os.path.join(root, "bodies"), exist_ok=True)
+        self._refs = {}
+        for e in os.scandir(os.path.join(root, "entries")):
+            entry = load_json(e.path, None)
+            if entry:
+                self._refs[entry["body"]] = self._refs.get(entry["body"], 0) + 1
+        self._size = sum(e.stat().st_size for e in os.scandir(os.path.join(root, "bodies")))
+        self._sweep()
+
+    def _entry_path(self, source, url, kind):
+        key = hashlib.sha256(f"{kind}|{source}|{url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "entries", key + ".json")
+
+    def _body_path(self, digest):
+        return os.path.join(self.root, "bodies", digest + ".html")
+
+    def lookup(self, source, url, kind="http"):
+        path = self._entry_path(source, url, kind)
+        entry = load_json(path, None)
+        if entry is None or not os.path.exists(self._body_path(entry["body"])):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        os.utime(path)  # mark as recently used
+        return entry
+
+    def is_fresh(self, entry):
+        ttl = CACHE_TTL.get(entry["source"], CACHE_DEFAULT_TTL)
+        return time.time() - entry["fetched_at"] < ttl
+
+    def read_body(self, entry):
+        with open(self._body_path(entry["body"]), encoding="utf-8") as f:
+            body = f.read()
+        with self._lock:
+            self._stats["hits"] += 1
+        return body
+
+    def validators(self, entry):
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, source, url, body, headers=None, kind="http"):
+        headers = headers or {}
+        data = body.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        body_path = self._body_path(digest)
+        path = self._entry_path(source, url, kind)
+        entry = {
+            "source": source, "url": url, "kind": kind, "body": digest, "size": len(data),
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"),
+        }
+        with self._lock:
+            if not os.path.exists(body_path):
+                tmp = f"{body_path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, body_path)
+                self._size += len(data)
+            old = load_json(path, None)
+            save_json_atomic(path, entry)
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            if old:  # the replaced entry no longer holds its body
+                self._release(old["body"])
+            self._stats["stored"] += 1
+            over = self._size > self.max_bytes
+        if over:
+            self.evict(keep=path)
+        return entry
+
+    # drops one reference to a body, deleting it with the last one (lock held)
+    def _release(self, digest):
+        self._refs[digest] = self._refs.get(digest, 0) - 1
+        if self._refs[digest] > 0:
+            return
+        del self._refs[digest]
+        body_path = self._body_path(digest)
+        try:
+            size = os.path.getsize(body_path)
+            os.remove(body_path)
+        except FileNotFoundError:
+            return
+        self._size -= size
+
+    # deletes bodies no entry points at (left by a crash between the writes)
+    def _sweep(self):
+        with self._lock:
+            for e in os.scandir(os.path.join(self.root, "bodies")):
+                if e.name.endswith(".html") and e.name[:-5] not in self._refs:
+                    try:
+                        size = e.stat().st_size
+                        os.remove(e.path)
+                    except FileNotFoundError:
+                        continue
+                    self._size -= size
+
+    def touch(self, entry):
+        # 304 Not Modified: the cached copy is good for another TTL
+        entry = dict(entry, fetched_at=time.time())
+        save_json_atomic(self._entry_path(entry["source"], entry["url"], entry["kind"]), entry)
+        with self._lock:
+            self._stats["revalidated"] += 1
+
+    # drops least recently used entries (never `keep`, the one just stored)
+    # until the bodies fit in max_bytes, then sweeps unreferenced bodies
+    def evict(self, keep=None):
+        entries_dir = os.path.join(self.root, "entries")
+        entries = sorted(os.scandir(entries_dir), key=lambda e: e.stat().st_mtime)
+        evicted = 0
+        for e in entries:
+            if e.path == keep:
+                continue
+            with self._lock:
+                if self._size <= self.max_bytes * 0.9:
+                    break
+                entry = load_json(e.path, None)
+                try:
+                    os.remove(e.path)
+                except FileNotFoundError:
+                    continue
+                evicted += 1
+                if entry:
+                    self._release(entry["body"])
+        self._sweep()
+        with self._lock:
+            self._stats["evicted"] += evicted
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, bytes=self._size)
+
+PAGE_CACHE = PageCache()
+
+# -> (body, entry); body is set when the cache can answer without the network,
+# entry is the (possibly stale) cached copy to revalidate against
+def cache_lookup(source, url):
+    if CACHE_MODE == "off":
+        return None, None
+    entry = PAGE_CACHE.lookup(source, url)
+    if CACHE_MODE == "replay":
+        if entry is None:
+            raise CacheMiss(f"{url} is not in the page cache")
+        return PAGE_CACHE.read_body(entry), entry
+    if entry is not None and PAGE_CACHE.is_fresh(entry):
+        return PAGE_CACHE.read_body(entry), entry
+    return None, entry
+
+# -> page body for a network response, handling 304 and filling the cache
+def cache_response(source, url, entry, status, body, headers):
+    if status == 304 and entry is not None:
+        PAGE_CACHE.touch(entry)
+        return PAGE_CACHE.read_body(entry)
+    if CACHE_MODE == "on":
+        PAGE_CACHE.store(source, url, body, headers)
+    return body
+
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3h - Scrape stage metrics (Prometheus text + JSON lines)
+# ------------------------------
+# every stage of a scrape is timed per source:
+#   driver_start    - Chrome cold start (source "pool")
+#   page_load       - HTTP download or driver.get()
+#   readiness_wait  - waiting for the page's cards to appear
+#   extraction      - pulling all cards out of a page (one per page)
+#   page_card_parse - applying the field map to a page's cards (one per page,
+#                     not per card); items = cards kept
+METRICS_DIR = os.path.join(SCRAPE_STATE_DIR, "metrics")
+METRICS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class StageMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agg = {}      # (stage, source) -> {"count", "seconds", "items", "buckets"}
+        self._events = []   # not yet exported to JSON lines
+
+    def observe(self, stage, source, seconds, items=0):
+        with self._lock:
+            agg = self._agg.get((stage, source))
+            if agg is None:
+                agg = self._agg[(stage, source)] = {
+                    "count": 0, "seconds": 0.0, "items": 0, "buckets": [0] * len(METRICS_BUCKETS)}
+            agg["count"] += 1
+            agg["seconds"] += seconds
+            agg["items"] += items
+            for i, le in enumerate(METRICS_BUCKETS):
+                if seconds <= le:
+                    agg["buckets"][i] += 1
+            self._events.append({"ts": time.time(), "stage": stage, "source": source,
+                                 "seconds": round(seconds, 6), "items": items})
+
+    # times the block; set out["items"] inside it to record a count
+    @contextmanager
+    def stage(self, stage, source):
+        out = {"items": 0}
+        t0 = time.perf_counter()
+        try:
+            yield out
+        finally:
+            self.observe(stage, source, time.perf_counter() - t0, out["items"])
+
+    def get(self, stage, source):
+        with self._lock:
+            agg = self._agg.get((stage, source))
+            return dict(agg) if agg else {"count": 0, "seconds": 0.0, "items": 0}
+
+    def reset(self):
+        with self._lock:
+            self._agg.clear()
+            self._events.clear()
+
+    def export_jsonl(self, path=os.path.join(METRICS_DIR, "stages.jsonl")):
+        with self._lock:
+            events, self._events = self._events, []
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for e in events:
+                f.write(json.dumps(e) + "\n")
+        return len(events)
+
+    # textfile-collector format; written via a temp file so scrapes never see half a file
+    def export_prometheus(self, path=os.path.join(METRICS_DIR, "scrape.prom")):
+        with self._lock:
+            agg = {k: dict(v, buckets=list(v["buckets"])) for k, v in self._agg.items()}
+        lines = [
+            "# HELP hackathon_scrape_stage_seconds Time spent per scrape stage.",
+            "# TYPE hackathon_scrape_stage_seconds histogram",
+        ]
+        for (stage, source), a in sorted(agg.items()):
+            labels = f'stage="{stage}",source="{source}"'
+            for le, n in zip(METRICS_BUCKETS, a["buckets"]):
+                lines.append(f'hackathon_scrape_stage_seconds_bucket{{{labels},le="{le}"}} {n}')
+            lines.append(f'hackathon_scrape_stage_seconds_bucket{{{labels},le="+Inf"}} {a["count"]}')
+            lines.append(f"hackathon_scrape_stage_seconds_sum{{{labels}}} {a['seconds']:.6f}")
+            lines.append(f"hackathon_scrape_stage_seconds_count{{{labels}}} {a['count']}")
+        lines += [
+            "# HELP hackathon_scrape_stage_items_total Items produced per scrape stage (cards kept for page_card_parse).",
+            "# TYPE hackathon_scrape_stage_items_total counter",
+        ]
+        for (stage, source), a in sorted(agg.items()):
+            lines.append(f'hackathon_scrape_stage_items_total{{stage="{stage}",source="{source}"}} {a["items"]}')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+
+METRICS = StageMetrics()
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3i - Per-source rate limiting (token buckets + backoff)
+# ------------------------------
+import random
+
+# sustained requests/sec and burst size per source
+RATE_LIMITS = {
+    "Devpost": {"rate": 2.0, "burst": 4},
+    "MLH": {"rate": 1.0, "burst": 2},
+    "Hackathon.com": {"rate": 1.0, "burst": 3},
+    "Eventbrite": {"rate": 0.5, "burst": 2},
+    "AngelHack": {"rate": 1.0, "burst": 2},
+}
+DEFAULT_RATE_LIMIT = {"rate": 1.0, "burst": 2}
+BACKOFF_BASE = 2.0   # seconds, doubled per consecutive throttled response
+BACKOFF_MAX = 60.0
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # backoff window after a throttled response
+        self.failures = 0
+
+    # takes a token and returns how long the caller has to wait before sending;
+    # tokens may go negative so concurrent callers queue up behind each other
+    def reserve(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class RequestScheduler:
+    # every outgoing page request of every scraper goes through acquire() /
+    # acquire_async() first, and reports its outcome with report()
+    def __init__(self, limits=RATE_LIMITS):
+        self.limits = limits
+        self._buckets = {}
+        self._queued = {}  # source -> list of seconds each request waited
+        self._backoffs = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, source):
+        with self._lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                limit = self.limits.get(source, DEFAULT_RATE_LIMIT)
+                bucket = self._buckets[source] = TokenBucket(limit["rate"], limit["burst"])
+            delay = bucket.reserve(time.monotonic())
+            self._queued.setdefault(source, []).append(delay)
+        return delay
+
+    def acquire(self, source):
+        delay = self._reserve(source)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, source):
+        delay = self._reserve(source)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    # throttled (429/503) or empty responses push the source into a jittered
+    # exponential backoff; anything else resets it
+    def report(self, source, status=None, empty=False, retry_after=None):
+        with self._lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                return
+            if status in THROTTLE_STATUSES or empty:
+                bucket.failures += 1
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (bucket.failures - 1))
+                delay = random.uniform(delay / 2, delay)
+                if retry_after:
+                    delay = max(delay, retry_after)
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+                self._backoffs[source] = self._backoffs.get(source, 0) + 1
+                print(f"[{source}] throttled (status={status}, empty={empty}), backing off {delay:.1f}s")
+            else:
+                bucket.failures = 0
+
+    # queue time per source: how long requests waited for a token / backoff
+    def stats(self):
+        with self._lock:
+            queued = {k: sorted(v) for k, v in self._queued.items()}
+            backoffs = dict(self._backoffs)
+        out = {}
+        for source, waits in queued.items():
+            out[source] = {
+                "requests": len(waits),
+                "queued_seconds": round(sum(waits), 3),
+                "p95_queued": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3),
+                "max_queued": round(waits[-1], 3),
+                "backoffs": backoffs.get(source, 0),
+            }
+        return out
+
+SCHEDULER = RequestScheduler()
+
+# for harnesses that only talk to a local server (Cell 11): a limit no crawl reaches
+UNTHROTTLED_LIMIT = {"rate": 1e6, "burst": 1e6}
+
+def unthrottled_scheduler():
+    return RequestScheduler(limits={source: UNTHROTTLED_LIMIT for source in SOURCE_URLS})
+
+# Retry-After in seconds (the HTTP-date form is ignored)
+def retry_after_seconds(headers):
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3j - Per-source deadlines & circuit breakers
+# ------------------------------
+# wall-clock budget (seconds) each source gets per run
+SOURCE_BUDGETS = {
+    "Devpost": 180,
+    "MLH": 60,
+    "Hackathon.com": 90,
+    "Eventbrite": 90,
+    "AngelHack": 60,
+}
+DEFAULT_SOURCE_BUDGET = 120
+BREAKER_THRESHOLD = 3         # consecutive empty / failed pages that open the breaker
+BREAKER_COOLDOWN = 6 * 3600   # seconds an open breaker keeps the source skipped
+
+
+class CircuitBreakers:
+    # consecutive-failure counts and open breakers per source; persisted so an
+    # open breaker also skips the source on the following runs until it cools down
+    def __init__(self, path=os.path.join(SCRAPE_STATE_DIR, "breakers.json")):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = load_json(path, {})
+
+    def is_open(self, source):
+        with self._lock:
+            return self._state.get(source, {}).get("open_until", 0) > time.time()
+
+    def record(self, source, ok, reason=""):
+        # returns True when this failure opened the breaker
+        with self._lock:
+            st = self._state.setdefault(source, {"failures": 0, "open_until": 0})
+            if ok:
+                st["failures"] = 0
+                return False
+            st["failures"] += 1
+            if st["failures"] < BREAKER_THRESHOLD:
+                return False
+            st["open_until"] = time.time() + BREAKER_COOLDOWN
+            st["reason"] = reason
+            st["failures"] = 0
+        print(f"[{source}] circuit breaker open for {BREAKER_COOLDOWN // 60} min ({reason})")
+        self.save()
+        return True
+
+    def save(self):
+        with self._lock:
+            state = json.loads(json.dumps(self._state))
+        save_json_atomic(self.path, state)
+
+BREAKERS = CircuitBreakers()
+
+
+class SourceGuard:
+    # one per source per run: tracks the deadline and why the source stopped.
+    # A source the run has given up on (abandon()) stops at its next page, and
+    # what its thread does afterwards no longer counts towards the breaker
+    def __init__(self, source):
+        self.source = source
+        self.budget = SOURCE_BUDGETS.get(source, DEFAULT_SOURCE_BUDGET)
+        self.deadline = time.monotonic() + self.budget
+        self.outcome = "ok"
+        self.abandoned = False
+
+    def abandon(self):
+        self.abandoned = True
+        self.outcome = "deadline"
+
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+    # caps a per-request timeout so a single page can't overrun the budget
+    def cap(self, timeout):
+        return max(1.0, min(timeout, self.remaining()))
+
+    def allow(self):
+        if self.abandoned:
+            return False
+        if BREAKERS.is_open(self.source):
+            self.outcome = "circuit_open"
+            return False
+        if self.remaining() <= 0:
+            self.outcome = "budget_exhausted"
+            return False
+        return True
+
+    def record(self, ok, reason="empty page"):
+        if self.abandoned:
+            return
+        if BREAKERS.record(self.source, ok, reason):
+            self.outcome = "circuit_open"
+
+RUN_GUARDS = {}
+_guards_lock = threading.Lock()
+
+# guards are created on first use and live until the next start_run_guards()
+def source_guard(source):
+    with _guards_lock:
+        guard = RUN_GUARDS.get(source)
+        if guard is None:
+            guard = RUN_GUARDS[source] = SourceGuard(source)
+        return guard
+
+def start_run_guards():
+    with _guards_lock:
+        RUN_GUARDS.clear()
+
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3k - Learned card selectors
+# ------------------------------
+# FIELD_MAPS lists several card selectors per source because the markup varies;
+# this remembers which one matched last time so it is tried first, and only
+# walks the rest of the chain when it comes back empty
+class SelectorCache:
+    def __init__(self, path=os.path.join(SCRAPE_STATE_DIR, "selector_cache.json")):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = load_json(path, {})  # source -> {"selector", "hits", "fallbacks", "misses"}
+
+    def ordered(self, source, chain):
+        with self._lock:
+            learned = self._data.get(source, {}).get("selector")
+        if learned in chain:
+            return [learned] + [sel for sel in chain if sel != learned]
+        return list(chain)
+
+    # `tried` is the order that was used, `used` the selector that matched (or None)
+    def learn(self, source, tried, used):
+        with self._lock:
+            st = self._data.setdefault(source, {"selector": None, "hits": 0, "fallbacks": 0, "misses": 0})
+            if used is None:
+                st["misses"] += 1
+                return
+            if used == tried[0]:
+                st["hits"] += 1
+                return
+            st["fallbacks"] += 1
+            changed = st["selector"] != used
+            st["selector"] = used
+        if changed:
+            print(f"[{source}] card selector is now {used!r}")
+            self.save()
+
+    def stats(self):
+        with self._lock:
+            data = json.loads(json.dumps(self._data))
+        for st in data.values():
+            total = st["hits"] + st["fallbacks"] + st["misses"]
+            st["hit_rate"] = round(st["hits"] / total, 3) if total else 0.0
+        return data
+
+    def save(self):
+        with self._lock:
+            data = json.loads(json.dumps(self._data))
+        save_json_atomic(self.path, data)
+
+SELECTOR_CACHE = SelectorCache()
+
+# FIELD_MAPS entry with the card selectors in learned order
+def learned_spec(source):
+    spec = FIELD_MAPS[source]
+    return dict(spec, cards=SELECTOR_CACHE.ordered(source, spec["cards"]))
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3l - Lean browser profiles (CDP request blocking)
+# ------------------------------
+# listing pages only need their HTML and scripts; a profile is a list of URL
+# patterns Chrome refuses to load (Network.setBlockedURLs, "*" wildcards).
+# Each source has a profile; when a page comes back without cards under a
+# blocking profile it is reloaded with the fallback, and if that finds cards the
+# source is switched over for good (scrape_state/browser_profiles.json)
+BLOCK_IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"]
+BLOCK_MEDIA = ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg", "*.wav", "*.mov"]
+BLOCK_FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+BLOCK_TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*segment.io*", "*segment.com/analytics*",
+    "*mixpanel.com*", "*amplitude.com*", "*fullstory.com*", "*intercom.io*", "*hubspot.com*",
+    "*hs-analytics.net*", "*clarity.ms*", "*bat.bing.com*", "*linkedin.com/px*", "*ads-twitter.com*",
+    "*sentry.io*", "*newrelic.com*", "*nr-data.net*", "*optimizely.com*", "*youtube.com/embed*",
+]
+
+BROWSER_PROFILES = {
+    "full": [],
+    "no-trackers": BLOCK_TRACKERS,
+    "lean": BLOCK_IMAGES + BLOCK_MEDIA + BLOCK_FONTS + BLOCK_TRACKERS,
+}
+# request blocking is opt-in per source until compare_browser_profiles() has been
+# run against real Chrome and shows the listings still render under it
+DEFAULT_BROWSER_PROFILE = "full"
+SOURCE_PROFILES = {}
+PROFILE_FALLBACK = {"lean": "full", "no-trackers": "full"}
+PROFILE_OVERRIDES_PATH = os.path.join(SCRAPE_STATE_DIR, "browser_profiles.json")
+PROFILE_OVERRIDES = load_json(PROFILE_OVERRIDES_PATH, {})
+_profiles_lock = threading.Lock()
+
+def source_profile(source):
+    with _profiles_lock:
+        override = PROFILE_OVERRIDES.get(source)
+    return override or SOURCE_PROFILES.get(source, DEFAULT_BROWSER_PROFILE)
+
+def demote_profile(source, profile):
+    print(f"[{source}] switching to the {profile} browser profile")
+    with _profiles_lock:
+        PROFILE_OVERRIDES[source] = profile
+        data = dict(PROFILE_OVERRIDES)
+    save_json_atomic(PROFILE_OVERRIDES_PATH, data)
+
+# blocked URLs stick to the browser tab, so they are only sent when the profile
+# changes. A browser that rejects the CDP calls keeps loading pages unblocked;
+# returns the profile actually in effect
+def use_profile(driver, profile):
+    if getattr(driver, "_browser_profile", None) != profile:
+        driver._browser_profile = profile
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BROWSER_PROFILES[profile]})
+            driver._active_profile = profile
+        except WebDriverException as e:
+            print(f"[use_profile] request blocking unavailable ({type(e).__name__}), loading pages unblocked")
+    return getattr(driver, "_active_profile", "full")
+
+# bytes and requests of the last page load, from Chrome's network log (needs
+# CAPTURE_NETWORK_LOG when the browser was started); load_ms is navigation start
+# to the load event
+def page_transfer(driver):
+    sent, blocked, size = 0, 0, 0
+    for entry in driver.get_log("performance"):
+        msg = json.loads(entry["message"])["message"]
+        method, params = msg.get("method"), msg.get("params", {})
+        if method == "Network.requestWillBeSent":
+            sent += 1
+        elif method == "Network.loadingFinished":
+            size += params.get("encodedDataLength", 0)
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked += 1
+    load_ms = driver.execute_script(
+        "const n = performance.getEntriesByType('navigation')[0];"
+        "return n && n.loadEventEnd ? n.loadEventEnd - n.startTime : null;")
+    return {"bytes": size, "requests": sent, "blocked": blocked, "load_ms": load_ms}
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 3m - Hackathon record (one schema for every source)
+# ------------------------------
+# scrapers, the work queue and the cleaning stages all pass Hackathon records.
+# __slots__ keeps them small (no per-record __dict__); Source and Mode come
+# from a handful of values and are interned, and every record of a run shares
+# one ScrapedAt string
+import sys
+import numpy as np
+from operator import attrgetter
+from hackathon_store import canonical_link, page_link
+
+HACKATHON_FIELDS = ("Source", "Title", "Date", "Location", "Link", "Mode", "Prize", "Deadline", "ScrapedAt")
+SCRAPE_STAMP = datetime.utcnow().isoformat()
+
+# called at the start of each scrape run
+def new_scrape_stamp():
+    global SCRAPE_STAMP
+    SCRAPE_STAMP = datetime.utcnow().isoformat()
+    return SCRAPE_STAMP
+
+def classify_mode(location):
+    if not isinstance(location, str) or location.strip() in ("", "N/A", "Varies", "nan"):
+        return "Unknown"
+    loc = location.lower()
+    return "Online" if "online" in loc or "virtual" in loc else "Offline"
+
+class Hackathon:
+    __slots__ = HACKATHON_FIELDS
+
+    def __init__(self, Source, Title, Date, Location, Link, Mode=None, Prize=None, Deadline=None, ScrapedAt=None):
+        self.Source = sys.intern(Source)
+        self.Title = Title
+        self.Date = Date
+        self.Location = Location
+        self.Link = Link
+        self.Mode = sys.intern(Mode or classify_mode(Location))
+        self.Prize = Prize
+        self.Deadline = Deadline
+        self.ScrapedAt = ScrapedAt or SCRAPE_STAMP
+
+    # older raw files used "Platform" instead of "Source" for some scrapers;
+    # a row with neither is kept as "Unknown" instead of failing its chunk
+    @classmethod
+    def from_dict(cls, d):
+        d = {k: v for k, v in d.items() if v == v}  # drop NaN
+        if d.get("Source") is None:
+            d["Source"] = d.get("Platform") or "Unknown"
+        return cls(**{f: d.get(f) for f in HACKATHON_FIELDS})
+
+    def as_dict(self):
+        return {f: getattr(self, f) for f in HACKATHON_FIELDS}
+
+    def __repr__(self):
+        return f"Hackathon({self.Source!r}, {self.Title!r}, {self.Date!r})"
+
+# card (FIELD_MAPS output) -> record, with the per-source fixed values. A card
+# without a usable link gets the listing page keyed by its title (page_link),
+# or no link at all if it has no title either; the store skips those
+def card_to_hackathon(source, card, page_url):
+    date, location, link = card.get("Date", "N/A"), card.get("Location", "N/A"), card["Link"]
+    if source == "Eventbrite":
+        location = "Online"  # the listing is the online-events search
+    elif source == "AngelHack":
+        date, location = "See website", "Varies"
+    if canonical_link(link) is None:
+        link = page_link(page_url, card["Title"])
+    return Hackathon(source, card["Title"], date, location, link)
+
+_field_getters = {f: attrgetter(f) for f in HACKATHON_FIELDS}
+
+# records -> {field: numpy object array}, one C-level pass per field
+def hackathons_to_columns(records):
+    records = records if isinstance(records, list) else list(records)
+    return {f: np.array(list(map(get, records)), dtype=object) for f, get in _field_getters.items()}
+
+# records -> DataFrame with Source and Mode as categoricals
+def hackathons_to_frame(records):
+    cols = hackathons_to_columns(records)
+    for f in ("Source", "Mode"):
+        cols[f] = pd.Categorical(cols[f])
+    return pd.DataFrame(cols, copy=False)
+
+
+# In[4]:
+
+
+# ------------------------------
+# Cell 4 - Scraper: Devpost (pagination)
+# ------------------------------
+def scrape_devpost(max_pages=10, timeout=None, driver=None, incremental=False):
+    found = 0
+    base = SOURCE_URLS["Devpost"]
+    with DriverLease(driver) as lease:
+        try:
+            # page 1 is the bare listing, later pages use the ?page=N param
+            pages = [(p, base if p == 1 else f"{base}?page={p}") for p in range(1, max_pages + 1)]
+            for page, url, cards, _ in paginate(pages, "Devpost", lease, incremental, timeout=timeout):
+                print(f"[Devpost] page {page}: {len(cards)} cards")
+                for c in cards:
+                    found += 1
+                    yield card_to_hackathon("Devpost", c, url)
+        except WebDriverException as e:
+            print("Devpost scraping driver error:", e)
+    print(f"[Devpost] done, found {found} items")
 
 
 # In[10]:
@@ -202,33 +1810,16 @@ def scrape_devpost(max_pages=10, pause=3):
     #     driver.quit()
     # print(f"[MLH] done, found {len(results)} items")
     # return results
-def mlh_scraper(driver):
-    print("START: MLH")
-    url = "https://mlh.io/seasons/2025/events"  # Adjust season if needed
-    driver.get(url)
-    time.sleep(3)
-
-    hackathons = []
-    events = driver.find_elements(By.CSS_SELECTOR, ".event-wrapper")
-    for e in events:
-        try:
-            title = e.find_element(By.CSS_SELECTOR, "h3").text.strip()
-            date = e.find_element(By.CSS_SELECTOR, ".event-date").text.strip()
-            location = e.find_element(By.CSS_SELECTOR, ".event-location").text.strip()
-            link = e.find_element(By.TAG_NAME, "a").get_attribute("href")
-            hackathons.append({
-                "Title": title,
-                "Date": date,
-                "Location": location,
-                "Link": link,
-                "Platform": "MLH",
-                "ScrapedAt": datetime.utcnow().isoformat()
-            })
-        except:
-            continue
+def mlh_scraper(driver=None, incremental=False):
+    found = 0
+    with DriverLease(driver) as lease:
+        url = SOURCE_URLS["MLH"]
+        for _, url, cards, _ in paginate([(1, url)], "MLH", lease, incremental):
+            for c in cards:
+                found += 1
+                yield card_to_hackathon("MLH", c, url)
 
-    print(f"[MLH] done, found {len(hackathons)} items")
-    return hackathons
+    print(f"[MLH] done, found {found} items")
 
 
 
@@ -283,38 +1874,19 @@ def mlh_scraper(driver):
     #     driver.quit()
     # print(f"[Hackathon.com] done, found {len(results)} items")
     # return results
-def hackathoncom_scraper(driver, max_pages=3):
-    print("START: Hackathon.com")
-    hackathons = []
-    base_url = "https://www.hackathon.com/city/online"
-
-    for page in range(1, max_pages + 1):
-        url = f"{base_url}?page={page}"
-        print(f"[Hackathon.com] loading page {page} ...")
-        driver.get(url)
-        time.sleep(5)
-
-        events = driver.find_elements(By.CSS_SELECTOR, ".event-item")
-        for e in events:
-            try:
-                title = e.find_element(By.CSS_SELECTOR, ".event-title").text.strip()
-                date = e.find_element(By.CSS_SELECTOR, ".event-date").text.strip()
-                location = e.find_element(By.CSS_SELECTOR, ".event-location").text.strip()
-                link = e.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-
-                hackathons.append({
-                    "Title": title,
-                    "Date": date,
-                    "Location": location,
-                    "Link": link,
-                    "Platform": "Hackathon.com",
-                    "ScrapedAt": datetime.utcnow().isoformat()
-                })
-            except:
-                continue
+def hackathoncom_scraper(driver=None, max_pages=3, incremental=False):
+    found = 0
+    with DriverLease(driver) as lease:
+        base_url = SOURCE_URLS["Hackathon.com"]
+
+        pages = [(p, f"{base_url}?page={p}") for p in range(1, max_pages + 1)]
+        for page, url, cards, _ in paginate(pages, "Hackathon.com", lease, incremental):
+            print(f"[Hackathon.com] page {page}: {len(cards)} cards")
+            for c in cards:
+                found += 1
+                yield card_to_hackathon("Hackathon.com", c, url)
 
-    print(f"[Hackathon.com] done, found {len(hackathons)} items")
-    return hackathons
+    print(f"[Hackathon.com] done, found {found} items")
 
 
 
@@ -371,35 +1943,19 @@ def hackathoncom_scraper(driver, max_pages=3):
     #     driver.quit()
     # print(f"[Eventbrite] done, found {len(results)} items")
     # return results
-def eventbrite_scraper(driver, max_pages=3):
-    print("START: Eventbrite")
-    hackathons = []
-    base = "https://www.eventbrite.com/d/online/hackathon/"
-
-    for page in range(1, max_pages + 1):
-        print(f"[Eventbrite] loading page {page} ...")
-        driver.get(f"{base}?page={page}")
-        time.sleep(5)
-
-        events = driver.find_elements(By.CSS_SELECTOR, "div[data-testid='event-card']")
-        for e in events:
-            try:
-                title = e.find_element(By.CSS_SELECTOR, "div.eds-event-card__formatted-name--is-clamped").text.strip()
-                date = e.find_element(By.CSS_SELECTOR, "div.eds-event-card-content__sub-title").text.strip()
-                link = e.find_element(By.TAG_NAME, "a").get_attribute("href")
-                hackathons.append({
-                    "Title": title,
-                    "Date": date,
-                    "Location": "Online",
-                    "Link": link,
-                    "Platform": "Eventbrite",
-                    "ScrapedAt": datetime.utcnow().isoformat()
-                })
-            except:
-                continue
+def eventbrite_scraper(driver=None, max_pages=3, incremental=False):
+    found = 0
+    with DriverLease(driver) as lease:
+        base = SOURCE_URLS["Eventbrite"]
+
+        pages = [(p, f"{base}?page={p}") for p in range(1, max_pages + 1)]
+        for page, url, cards, _ in paginate(pages, "Eventbrite", lease, incremental):
+            print(f"[Eventbrite] page {page}: {len(cards)} cards")
+            for c in cards:
+                found += 1
+                yield card_to_hackathon("Eventbrite", c, url)
 
-    print(f"[Eventbrite] done, found {len(hackathons)} items")
-    return hackathons
+    print(f"[Eventbrite] done, found {found} items")
 
 
 
@@ -409,78 +1965,472 @@ def eventbrite_scraper(driver, max_pages=3):
 # ------------------------------
 # Cell 8 - Scraper: AngelHack (events page)
 # ------------------------------
-def scrape_angelhack(pause=3):
-    results = []
-    driver = get_driver(headless=True)
-    try:
-        url = "https://angelhack.com/events/"
-        driver.get(url)
-        time.sleep(pause)
-        # AngelHack pages are often built with elementor; try to find posts / event elements
-        cards = driver.find_elements(By.CSS_SELECTOR, ".elementor-post") \
-                or driver.find_elements(By.CSS_SELECTOR, ".elementor-widget-container") \
-                or driver.find_elements(By.CSS_SELECTOR, ".event")
-        for c in cards:
-            # get h3 or h2 text if present
-            title = "N/A"
-            try:
-                title = safe_text(c.find_element(By.TAG_NAME, "h3"))
-            except:
-                try:
-                    title = safe_text(c.find_element(By.TAG_NAME, "h2"))
-                except:
-                    # fallback: whole text snippet
-                    try:
-                        title = safe_text(c)
-                    except:
-                        title = "N/A"
+def scrape_angelhack(timeout=None, driver=None, incremental=False):
+    found = 0
+    with DriverLease(driver) as lease:
+        try:
+            url = SOURCE_URLS["AngelHack"]
+            # AngelHack pages are often built with elementor; the field map tries posts,
+            # widgets and event elements, and falls back to the card text for the title
+            for _, url, cards, _ in paginate([(1, url)], "AngelHack", lease, incremental, timeout=timeout):
+                for c in cards:
+                    found += 1
+                    yield card_to_hackathon("AngelHack", c, url)
+        except WebDriverException as e:
+            print("AngelHack scraping driver error:", e)
+    print(f"[AngelHack] done, found {found} items")
+
+
+# In[ ]:
+
+
+# ------------------------------
+# Cell 8a - Streaming record sink (JSON lines)
+# ------------------------------
+# the scrapers above are generators; records are appended to a JSON-lines file
+# as they are produced, so memory stays flat and a crash keeps everything
+# written so far. Lines are flushed per record and fsync'ed periodically.
+RAW_OUTPUT = "hackathons_raw.jsonl"
+
+class SinkClosed(Exception):
+    pass
+
+class JsonlSink:
+    def __init__(self, path, fsync_every=200, fsync_interval=5.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.written = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, record):
+        if isinstance(record, Hackathon):
+            record = record.as_dict()
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._f.closed:
+                raise SinkClosed(self.path)
+            self._f.write(line)
+            self._f.flush()
+            self.written += 1
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._f.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if not self._f.closed:
+                self._f.flush()
+                self._sync()
+                self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+# reads a JSON-lines stream back as DataFrame chunks of Hackathon records (one
+# schema, Source and Mode categorical; lines from before it are mapped by
+# Hackathon.from_dict); a torn last line from a crash is skipped
+def read_jsonl_chunks(path, chunksize=5000):
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
             try:
-                link = c.find_element(By.TAG_NAME, "a").get_attribute("href")
-            except:
-                link = url  # if no item-specific link, use the events page
-            results.append({
-                "Source": "AngelHack",
-                "Title": title,
-                "Date": "See website",
-                "Location": "Varies",
-                "Link": link,
-                "ScrapedAt": datetime.utcnow().isoformat()
-            })
-    except WebDriverException as e:
-        print("AngelHack scraping driver error:", e)
-    finally:
-        driver.quit()
-    print(f"[AngelHack] done, found {len(results)} items")
-    return results
+                records.append(Hackathon.from_dict(json.loads(line)))
+            except json.JSONDecodeError:
+                continue
+            if len(records) >= chunksize:
+                yield hackathons_to_frame(records)
+                records = []
+    if records:
+        yield hackathons_to_frame(records)
 
 
 # In[15]:
 
 
 # ------------------------------
-# Cell 9 - Run all scrapers & combine results
+# Cell 8b - Scrape work queue (SQLite backend)
 # ------------------------------
-all_results = []
-
-# Run Devpost (limit pages to avoid very long runs; increase if needed)
-print("START: Devpost")
-all_results.extend(scrape_devpost(max_pages=5, pause=3))
+# splits scraping into (source, page) tasks that any number of workers can pull.
+# A worker leases a task, runs the normal per-page extraction (fetch_cards) and
+# stores the cards on the task. A lease that is not completed in time (worker
+# died) expires and the task goes back to the queue; failures are retried with
+# backoff until QUEUE_MAX_ATTEMPTS. SQLite keeps this testable on one box; every
+# call opens its own connection, so workers can be threads or separate processes
+# sharing the file. Another backend only needs the same methods.
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUE_PATH = os.path.join(SCRAPE_STATE_DIR, "work_queue.db")
+QUEUE_LEASE_SECONDS = 120
+QUEUE_MAX_ATTEMPTS = 3
+QUEUE_RETRY_DELAY = 5.0  # seconds, doubled per failed attempt
+
+# listing pages per source, same URLs the scrapers walk
+def queue_pages(source, max_pages):
+    base = SOURCE_URLS[source]
+    if source in ("MLH", "AngelHack"):
+        return [(1, base)]
+    if source == "Devpost":
+        return [(p, base if p == 1 else f"{base}?page={p}") for p in range(1, max_pages + 1)]
+    return [(p, f"{base}?page={p}") for p in range(1, max_pages + 1)]
+
+class SqliteWorkQueue:
+    def __init__(self, path=QUEUE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._tx() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL, page INTEGER NOT NULL, url TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',  -- pending/leased/done/failed/skipped
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_until REAL, worker TEXT,
+                result TEXT, error TEXT, seconds REAL,
+                UNIQUE (source, page))""")
+            db.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, available_at)")
+
+    @contextmanager
+    def _tx(self):
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("BEGIN IMMEDIATE")  # one writer at a time, so a lease is never handed out twice
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+    def enqueue(self, source, pages):
+        with self._tx() as db:
+            db.executemany("INSERT OR IGNORE INTO tasks (source, page, url) VALUES (?, ?, ?)",
+                           [(source, page, url) for page, url in pages])
+
+    # next runnable task (pending, or leased with an expired lease), or None
+    def lease(self, worker, lease_seconds=QUEUE_LEASE_SECONDS):
+        now = time.time()
+        with self._tx() as db:
+            while True:
+                row = db.execute(
+                    "SELECT id, source, page, url, attempts FROM tasks"
+                    " WHERE (status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_until < ?)"
+                    " ORDER BY page, id LIMIT 1", (now, now)).fetchone()
+                if row is None:
+                    return None
+                task_id, source, page, url, attempts = row
+                if attempts < QUEUE_MAX_ATTEMPTS:
+                    break
+                # its last lease expired without a result
+                db.execute("UPDATE tasks SET status = 'failed', error = 'lease expired' WHERE id = ?", (task_id,))
+            db.execute("UPDATE tasks SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1"
+                       " WHERE id = ?", (worker, now + lease_seconds, task_id))
+        return {"id": task_id, "source": source, "page": page, "url": url, "attempts": attempts + 1}
+
+    # False if the lease was lost in the meantime (the task belongs to someone else now)
+    def complete(self, task, worker, cards, seconds=None):
+        with self._tx() as db:
+            cur = db.execute("UPDATE tasks SET status = 'done', result = ?, seconds = ?, lease_until = NULL"
+                             " WHERE id = ? AND worker = ? AND status = 'leased'",
+                             (json.dumps(cards, ensure_ascii=False), seconds, task["id"], worker))
+            if cur.rowcount and not cards:
+                # an empty page ends pagination: later pages of this source won't have cards either
+                db.execute("UPDATE tasks SET status = 'skipped' WHERE source = ? AND page > ? AND status = 'pending'",
+                           (task["source"], task["page"]))
+            return cur.rowcount == 1
+
+    def fail(self, task, worker, error):
+        retry = task["attempts"] < QUEUE_MAX_ATTEMPTS
+        delay = QUEUE_RETRY_DELAY * 2 ** (task["attempts"] - 1)
+        with self._tx() as db:
+            db.execute("UPDATE tasks SET status = ?, error = ?, available_at = ?, lease_until = NULL"
+                       " WHERE id = ? AND worker = ? AND status = 'leased'",
+                       ("pending" if retry else "failed", error, time.time() + delay, task["id"], worker))
+
+    # drops the remaining work of a source, including tasks leased right now
+    def skip(self, source, reason):
+        with self._tx() as db:
+            db.execute("UPDATE tasks SET status = 'skipped', error = ?, lease_until = NULL"
+                       " WHERE source = ? AND status IN ('pending', 'leased')", (reason, source))
+
+    # True while there is pending or leased work (including tasks waiting out a retry delay)
+    def active(self):
+        with self._tx() as db:
+            return db.execute("SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')").fetchone()[0] > 0
+
+    # streams the collected results as records, in source/page order
+    def results(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            rows = db.execute("SELECT source, url, result FROM tasks WHERE status = 'done' ORDER BY source, page")
+            for source, url, result in rows:
+                for card in json.loads(result):
+                    yield card_to_hackathon(source, card, url)
+        finally:
+            db.close()
+
+    def stats(self):
+        with self._tx() as db:
+            out = {}
+            for source, status, n, secs in db.execute(
+                    "SELECT source, status, COUNT(*), SUM(seconds) FROM tasks GROUP BY source, status"):
+                st = out.setdefault(source, {})
+                st[status] = n
+                if status == "done":
+                    st["seconds"] = round(secs or 0.0, 2)
+            return out
+
+    def clear(self):
+        with self._tx() as db:
+            db.execute("DELETE FROM tasks")
+
+# worker loop: pulls tasks until the queue has no pending or leased work left.
+# Run it in threads here, or from another process/machine pointing at the queue
+def queue_worker(queue, worker_id, idle_sleep=0.5):
+    done = 0
+    with DriverLease() as lease:
+        while True:
+            task = queue.lease(worker_id)
+            if task is None:
+                if not queue.active():
+                    break
+                time.sleep(idle_sleep)  # others hold leases or a retry is waiting
+                continue
+            source = task["source"]
+            guard = source_guard(source)
+            if not guard.allow():
+                # breaker open or the source's budget for this run is spent
+                queue.skip(source, guard.outcome)
+                continue
+            t0 = time.perf_counter()
+            expect_cards = task["page"] == 1
+            try:
+                cards, info = fetch_cards(task["url"], source, lease, expect_cards=expect_cards)
+            except Exception as e:
+                guard.record(False, reason=repr(e))
+                queue.fail(task, worker_id, repr(e))
+                continue
+            guard.record(bool(cards) or not empty_is_anomalous(info, expect_cards))
+            if queue.complete(task, worker_id, cards, time.perf_counter() - t0):
+                done += 1
+                print(f"[{worker_id}] {source} page {task['page']}: {len(cards)} cards")
+    return done
+
+def run_queue_workers(queue, workers):
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qworker") as pool:
+        done = sum(pool.map(lambda i: queue_worker(queue, f"worker-{i}"), range(workers)))
+    return done, time.perf_counter() - t0
+
+# enqueues the sources' pages, runs the workers and streams the results into the sink
+def run_work_queue(max_pages, sink, workers=3, path=QUEUE_PATH):
+    DRIVER_POOL.size = max(DRIVER_POOL.size, workers)
+    start_run_guards()
+    new_scrape_stamp()
+    queue = SqliteWorkQueue(path)
+    queue.clear()
+    for source, n in max_pages.items():
+        queue.enqueue(source, queue_pages(source, n))
+    done, elapsed = run_queue_workers(queue, workers)
+    for record in queue.results():
+        sink.write(record)
+    BREAKERS.save()
+    stats = queue.stats()
+    print(f"Work queue: {done} tasks in {elapsed:.1f}s with {workers} workers")
+    return stats
+
+# throughput as workers are added; uses the network every time (cache off).
+# throttle=False lifts the per-source rate limits, which would otherwise cap
+# every worker count at the same rate; only for a local server (Cell 11)
+def measure_queue_scaling(max_pages, worker_counts=(1, 2, 4, 8), path=os.path.join(SCRAPE_STATE_DIR, "queue_scaling.db"),
+                          throttle=True):
+    global CACHE_MODE, SCHEDULER
+    saved_mode, saved_scheduler, CACHE_MODE = CACHE_MODE, SCHEDULER, "off"
+    rows = []
+    try:
+        for workers in worker_counts:
+            DRIVER_POOL.size = max(DRIVER_POOL.size, workers)
+            start_run_guards()
+            queue = SqliteWorkQueue(path)
+            queue.clear()
+            for source, n in max_pages.items():
+                queue.enqueue(source, queue_pages(source, n))
+            if not throttle:
+                SCHEDULER = unthrottled_scheduler()
+            done, elapsed = run_queue_workers(queue, workers)
+            rows.append({"workers": workers, "tasks": done, "seconds": round(elapsed, 2),
+                         "tasks_per_sec": round(done / elapsed, 3) if elapsed else 0.0})
+            print(rows[-1])
+    finally:
+        CACHE_MODE, SCHEDULER = saved_mode, saved_scheduler
+    base = rows[0]["tasks_per_sec"] if rows and rows[0]["tasks_per_sec"] else None
+    for r in rows:
+        r["speedup"] = round(r["tasks_per_sec"] / base, 2) if base else None
+    return pd.DataFrame(rows)
 
-print("START: MLH")
-all_results.extend(scrape_mlh(pause=3))
 
-print("START: Hackathon.com")
-all_results.extend(scrape_hackathon_com(pause=3))
+# In[ ]:
 
-print("START: Eventbrite")
-all_results.extend(scrape_eventbrite(max_pages=2, pause=4))
 
-print("START: AngelHack")
-all_results.extend(scrape_angelhack(pause=3))
+# ------------------------------
+# Cell 9 - Run all scrapers & combine results
+# ------------------------------
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# how many sources scrape at the same time (each one holds its own browser)
+MAX_SCRAPE_WORKERS = 3
+
+# routine refresh: only emit listings that are new or changed since the last run
+# and stop paginating at the first page without anything new (see Cell 3f)
+INCREMENTAL_CRAWL = False
+
+# to re-run the cleaning / enrich cells from the last crawl's pages without any
+# network access, set CACHE_MODE = "replay" (Cell 3g) before running this cell
+
+# one job per source; Devpost pages are limited to avoid very long runs.
+# scrapers fetch over plain HTTP first and borrow a pooled browser only if needed
+SCRAPE_JOBS = {
+    "Devpost": lambda: scrape_devpost(max_pages=5, incremental=INCREMENTAL_CRAWL),
+    "MLH": lambda: mlh_scraper(incremental=INCREMENTAL_CRAWL),
+    "Hackathon.com": lambda: hackathoncom_scraper(max_pages=3, incremental=INCREMENTAL_CRAWL),
+    "Eventbrite": lambda: eventbrite_scraper(max_pages=2, incremental=INCREMENTAL_CRAWL),
+    "AngelHack": lambda: scrape_angelhack(incremental=INCREMENTAL_CRAWL),
+}
+
+# runs a single source in a worker thread and streams its records into the sink;
+# failures are reported, never raised, so one broken scraper can't take the
+# others down (records written before the failure are kept)
+def run_source(name, job, sink):
+    if BREAKERS.is_open(name):
+        print(f"SKIP: {name} (circuit breaker open)")
+        return {"source": name, "status": "circuit_open", "rows": 0, "seconds": 0.0}
+    print(f"START: {name}")
+    guard = source_guard(name)
+    t0 = time.perf_counter()
+    rows = 0
+    try:
+        for record in job():
+            if guard.abandoned:
+                break
+            sink.write(record)
+            rows += 1
+        return {"source": name, "status": guard.outcome, "rows": rows, "seconds": time.perf_counter() - t0}
+    except SinkClosed:
+        # left behind at the run deadline; the run has already reported it
+        return {"source": name, "status": "deadline", "rows": rows, "seconds": time.perf_counter() - t0}
+    except Exception as e:
+        guard.record(False, reason=repr(e))
+        return {"source": name, "status": "error", "rows": rows, "error": repr(e),
+                "seconds": time.perf_counter() - t0}
+
+# threads rather than processes: the workers spend their time waiting on Chrome,
+# and notebook-defined scrapers can't be pickled into a process pool
+# each source gets its budget (plus a little grace) from the moment a worker
+# picks it up, so sources queued behind MAX_SCRAPE_WORKERS aren't cut short.
+# A source still running past that is reported as "deadline" and left behind;
+# queued sources that can't start because every worker is stuck on one are
+# reported the same way
+def run_scrapers_parallel(jobs, sink, max_workers=MAX_SCRAPE_WORKERS, grace=30, poll=1.0):
+    DRIVER_POOL.size = max(DRIVER_POOL.size, max_workers)
+    start_run_guards()
+    new_scrape_stamp()
+    report = {}
+    t0 = time.perf_counter()
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape")
+    futures = {pool.submit(run_source, name, job, sink): name for name, job in jobs.items()}
+    pending, stuck = set(futures), set()
+
+    def give_up(fut, why):
+        name = futures[fut]
+        report[name] = {"status": "deadline", "rows": 0, "seconds": round(time.perf_counter() - t0, 1)}
+        print(f"[{name}] {why}, moving on without it")
+        pending.discard(fut)
 
-# Convert to DataFrame
-df = pd.DataFrame(all_results)
-print("Combined total rows (before dedupe):", len(df))
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            stuck = {fut for fut in stuck if not fut.done()}
+            for fut in list(pending - done):
+                guard = RUN_GUARDS.get(futures[fut])
+                if guard is not None and time.monotonic() > guard.deadline + grace:
+                    guard.abandon()
+                    stuck.add(fut)
+                    give_up(fut, "still running past its budget")
+                elif not fut.running() and len(stuck) >= max_workers and fut.cancel():
+                    give_up(fut, "never started, every worker is stuck")
+            for fut in done:
+                pending.discard(fut)
+                out = fut.result()
+                name = out["source"]
+                report[name] = {"status": out["status"], "rows": out["rows"],
+                                "seconds": round(out["seconds"], 1)}
+                if out["status"] == "error":
+                    report[name]["error"] = out["error"]
+                    print(f"[{name}] failed after {out['seconds']:.1f}s: {out['error']}")
+                else:
+                    print(f"[{name}] wrote {out['rows']} rows after {out['seconds']:.1f}s ({out['status']})")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        BREAKERS.save()
+    save_json_atomic(os.path.join(SCRAPE_STATE_DIR, "last_run.json"), report)
+    total = time.perf_counter() - t0
+    slowest = max((r["seconds"] for r in report.values()), default=0.0)
+    print(f"All sources done in {total:.1f}s (slowest single source: {slowest:.1f}s)")
+    return report
+
+
+# USE_WORK_QUEUE runs the same sources as (source, page) tasks through the work
+# queue (Cell 8b) instead of one thread per source
+USE_WORK_QUEUE = False
+QUEUE_MAX_PAGES = {"Devpost": 5, "MLH": 1, "Hackathon.com": 3, "Eventbrite": 2, "AngelHack": 1}
+
+# each run gets its own driver pool: the previous run closed its pool at the end
+# of this cell, and a closed pool can't lend browsers again
+DRIVER_POOL.close()
+DRIVER_POOL = make_driver_pool()
+
+# each run starts a fresh stream, unless it resumes an interrupted crawl whose
+# earlier pages are already in the stream
+if CHECKPOINTS.pending():
+    print("Resuming interrupted crawls:", CHECKPOINTS.pending())
+elif os.path.exists(RAW_OUTPUT):
+    os.remove(RAW_OUTPUT)
+with JsonlSink(RAW_OUTPUT) as sink:
+    if USE_WORK_QUEUE:
+        scrape_report = run_work_queue(QUEUE_MAX_PAGES, sink, workers=MAX_SCRAPE_WORKERS)
+    else:
+        scrape_report = run_scrapers_parallel(SCRAPE_JOBS, sink)
+    print(f"Streamed {sink.written} rows to {RAW_OUTPUT}")
+
+print("Driver pool:", DRIVER_POOL.stats())
+print("Readiness:", readiness_stats())
+print("Page cache:", PAGE_CACHE.stats())
+print("Request queueing:", SCHEDULER.stats())
+print("Card selectors:", SELECTOR_CACHE.stats())
+SELECTOR_CACHE.save()
+METRICS.export_prometheus()
+print("Stage metrics: exported", METRICS.export_jsonl(), "events to", METRICS_DIR)
+DRIVER_POOL.close()
+
+# peek at the first chunk of the stream
+df = next(read_jsonl_chunks(RAW_OUTPUT), pd.DataFrame())
+print("Combined total rows (before dedupe):", sink.written)
 df.sample(min(5, len(df)))
 
 
@@ -488,72 +2438,561 @@ df.sample(min(5, len(df)))
 
 
 # ------------------------------
-# Cell 10 - Clean, dedupe, save to hackathons.csv
+# Cell 10 - Dedupe and upsert into the hackathon store
 # ------------------------------
-# basic cleaning: drop exact duplicate rows, then dedupe by Title+Link
-df_clean = df.drop_duplicates()
-df_clean = df_clean.drop_duplicates(subset=["Title", "Link"])
-# optional: reset index
-df_clean = df_clean.reset_index(drop=True)
+# every stage from here on reads and upserts rows of the SQLite store
+# (hackathon_store.py, hackathons.db) instead of rewriting a CSV
+from hackathon_store import HackathonStore, DedupeIndex, SNAPSHOT_PATH, write_snapshot, load_snapshot
+
+STORE = HackathonStore()
+DEDUPE_INDEX = DedupeIndex(STORE)
+RAW_COLUMNS = list(HACKATHON_FIELDS)
+# a record counts as updated when one of these changed (ScrapedAt always does)
+DEDUPE_CONTENT = ["Source", "RawDate", "Location", "Mode"]
+
+# streams the scrape into the store, chunk by chunk. Each chunk is checked
+# against the persistent dedupe index (hashed canonical link, like the store):
+# repeats collapse, and only new or changed records are upserted, so a run's cost
+# follows the size of the scrape, not of the store; the rest only get their
+# ScrapedAt moved forward (the dashboard's "Last Updated"). new / updated come
+# from the store's upsert, so they match what actually changed in hackathons.db
+def store_chunks(chunks, store=STORE, index=DEDUPE_INDEX):
+    totals = {"new": 0, "updated": 0, "unchanged": 0, "repeated": 0}
+    for chunk in chunks:
+        chunk = chunk.reindex(columns=RAW_COLUMNS).rename(columns={"Date": "RawDate"})
+        changed, counts, entries = index.check(chunk, DEDUPE_CONTENT)
+        stored = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if len(changed):
+            stored = store.upsert(changed, ["Source", "Title", "RawDate", "Location", "Mode", "ScrapedAt"])
+        if len(changed) < len(chunk):
+            store.touch(chunk.drop(index=changed.index))
+        index.mark(entries)
+        totals["new"] += stored["inserted"]
+        totals["updated"] += stored["updated"]
+        totals["unchanged"] += counts["unchanged"] + stored["unchanged"]
+        totals["repeated"] += counts["repeated"]
+    return totals
+
+totals = store_chunks(read_jsonl_chunks(RAW_OUTPUT))
+print(f"✅ Stored scraped hackathons in {STORE.path}: {totals}"
+      f" ({DEDUPE_INDEX.count()} records in the dedupe index)")
+
+# show the most recently changed rows
+STORE.query("SELECT Source, Title, RawDate, Location, Link FROM hackathons ORDER BY UpdatedAt DESC LIMIT 30")
 
-# Save CSV
-output_file = "hackathons.csv"
-df_clean.to_csv(output_file, index=False)
-print(f"✅ Saved {len(df_clean)} unique hackathons to {output_file}")
 
-# show top rows
-df_clean.head(30)
+# In[ ]:
+
+
+# ------------------------------
+# Cell 10a - Detail-page enrichment (dates, location, prize, deadline)
+# ------------------------------
+# listing cards carry little (AngelHack has no dates at all, Devpost locations are
+# often N/A), so this visits each row's Link and reads the event page. Pages are
+# fetched a few at a time through the page cache, rate limited per host. Results
+# are kept in scrape_state/enriched.json by link, and enriched rows are stamped
+# in the store, so a later run only fetches events it hasn't enriched before.
+import re
+from urllib.parse import urlparse
+from hackathon_store import PLACEHOLDERS  # same "not known" values as the store
+
+ENRICH_CONCURRENCY = 8
+ENRICHED_PATH = os.path.join(SCRAPE_STATE_DIR, "enriched.json")
+ENRICH_FIELDS = ["Date", "Location", "Prize", "Deadline"]
+
+# css selectors tried per field on a source's event page; used for whatever the
+# page's schema.org Event data (if any) doesn't provide
+DETAIL_FIELD_MAPS = {
+    "Devpost": {
+        "Date": ["#challenge-sidebar .submission-period", ".submission-period", ".dates"],
+        "Location": ["#challenge-sidebar .info-with-icon .info", ".challenge-location", ".location"],
+        "Prize": ["#challenge-sidebar .prize-total", ".prizes .prize-amount", ".prize-amount"],
+        "Deadline": ["#challenge-sidebar .date-range", ".deadline", "time.deadline"],
+    },
+    "MLH": {
+        "Date": [".event-date", "time"],
+        "Location": [".event-location", ".location"],
+    },
+    "Hackathon.com": {
+        "Date": [".event-date", ".date"],
+        "Location": [".event-location", ".location"],
+        "Prize": [".prize", ".prizes"],
+        "Deadline": [".deadline", ".registration-deadline"],
+    },
+    "Eventbrite": {
+        "Date": ["time.start-date-and-location__date", "[data-testid='event-datetime']", ".date-info"],
+        "Location": [".location-info__address", "[data-testid='location']"],
+    },
+    "AngelHack": {
+        "Date": [".elementor-icon-list-text", ".event-date", "time"],
+        "Location": [".event-location", ".location"],
+        "Prize": [".prize", ".prizes"],
+        "Deadline": [".deadline"],
+    },
+}
+
+# last resort on the page text
+PRIZE_RE = re.compile(r"(?:[$€£]\s?\d[\d,.]*(?:\s?[kKmM]\b)?|\b\d[\d,.]*\s?(?:USD|EUR|GBP)\b)(?:\s+in\s+(?:cash|prizes))?")
+DEADLINE_RE = re.compile(
+    r"(?:deadline|submissions?\s+(?:due|close[sd]?)|register\s+by)\s*[:\-–]?\s*"
+    r"((?:[A-Z][a-z]{2,8}\.?\s+\d{1,2}(?:,?\s+\d{4})?)|\d{4}-\d{2}-\d{2})", re.I)
+
+def _ld_location(loc):
+    if isinstance(loc, list):
+        loc = loc[0] if loc else None
+    if not isinstance(loc, dict):
+        return loc if isinstance(loc, str) else None
+    if "VirtualLocation" in str(loc.get("@type", "")):
+        return "Online"
+    addr = loc.get("address")
+    if isinstance(addr, dict):
+        addr = ", ".join(addr[k] for k in ("addressLocality", "addressRegion", "addressCountry")
+                         if isinstance(addr.get(k), str))
+    return loc.get("name") or addr or None
+
+# schema.org Event data from the page's JSON-LD blocks
+def _ld_event_details(doc):
+    for script in doc.xpath("//script[@type='application/ld+json']"):
+        try:
+            data = json.loads(script.text_content())
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get("@graph", [data]) if isinstance(data, dict) else []
+        for item in items:
+            if not isinstance(item, dict) or "Event" not in str(item.get("@type", "")):
+                continue
+            out = {}
+            start, end = str(item.get("startDate") or "")[:10], str(item.get("endDate") or "")[:10]
+            if start:
+                out["Date"] = start if not end or end == start else f"{start} - {end}"
+            if "OnlineEventAttendanceMode" in str(item.get("eventAttendanceMode", "")):
+                out["Location"] = "Online"
+            else:
+                loc = _ld_location(item.get("location"))
+                if loc:
+                    out["Location"] = loc
+            return out
+    return {}
+
+# -> {field: value} for what the page tells; missing fields are left out
+def extract_details(html, source, url):
+    with METRICS.stage("detail_parse", source):
+        doc = parse_html(html)
+        if doc is None:  # empty or not HTML: nothing to learn from the page
+            return {}
+        details = _ld_event_details(doc)
+        for field, selectors in DETAIL_FIELD_MAPS.get(source, {}).items():
+            if field in details:
+                continue
+            for sel in selectors:
+                found = [t for t in (node_text(el) for el in doc.cssselect(sel)) if t]
+                if found:
+                    details[field] = found[0]
+                    break
+        text = node_text(doc)
+        if "Prize" not in details:
+            m = PRIZE_RE.search(text)
+            if m:
+                details["Prize"] = m.group(0)
+        if "Deadline" not in details:
+            m = DEADLINE_RE.search(text)
+            if m:
+                details["Deadline"] = m.group(1)
+        return details
+
+# fetches the event pages of `rows` ([(source, link)]) concurrently, at most
+# `concurrency` at a time; -> {link: details} for the pages that loaded
+async def fetch_details_async(rows, concurrency=ENRICH_CONCURRENCY):
+    limit = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS, timeout=timeout) as session:
+        async def one(source, link):
+            host = urlparse(link).netloc  # detail pages are rate limited per host
+            async with limit:
+                try:
+                    html, entry = cache_lookup(source, link)
+                    if html is None:
+                        await SCHEDULER.acquire_async(host)
+                        with METRICS.stage("detail_load", source):
+                            async with session.get(link, headers=PAGE_CACHE.validators(entry)) as resp:
+                                SCHEDULER.report(host, resp.status, retry_after=retry_after_seconds(resp.headers))
+                                if resp.status != 304:
+                                    resp.raise_for_status()
+                                body = await resp.text()
+                        html = cache_response(source, link, entry, resp.status, body, resp.headers)
+                except aiohttp.ClientResponseError as e:
+                    print(f"[{source}] detail page failed: {link} (HTTP {e.status})")
+                    # a page that is gone won't come back; remember it so it isn't retried
+                    return link, {} if e.status in (404, 410) else None
+                except (aiohttp.ClientError, asyncio.TimeoutError, CacheMiss, UnicodeDecodeError) as e:
+                    print(f"[{source}] detail page failed: {link} ({type(e).__name__})")
+                    return link, None
+            return link, extract_details(html, source, link)
+
+        # one page that breaks in an unexpected way must not discard the batch
+        results = await asyncio.gather(*(one(source, link) for source, link in rows), return_exceptions=True)
+    out = {}
+    for (source, link), result in zip(rows, results):
+        if isinstance(result, Exception):
+            print(f"[{source}] detail page failed: {link} ({type(result).__name__}: {result})")
+        elif result[1] is not None:
+            out[link] = result[1]
+    return out
+
+# sync wrapper: private event loop in a worker thread, so it also runs inside Jupyter
+# (errors in the thread are raised again in the caller)
+def fetch_details(rows, concurrency=ENRICH_CONCURRENCY):
+    out, errors = {}, []
+    def runner():
+        loop = asyncio.new_event_loop()
+        try:
+            out.update(loop.run_until_complete(fetch_details_async(rows, concurrency)))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            loop.close()
+    t = threading.Thread(target=runner, name="enrich")
+    t.start()
+    t.join()
+    if errors:
+        raise errors[0]
+    return out
+
+# fills placeholder Date/Location from the event page and adds Prize/Deadline
+def enrich_listings(df, concurrency=ENRICH_CONCURRENCY, path=ENRICHED_PATH):
+    known = load_json(path, {})
+    todo, queued = [], set()
+    for row in df.to_dict("records"):
+        link, source = row.get("Link"), row.get("Source")
+        if isinstance(link, str) and link.startswith("http") and link not in known and link not in queued:
+            todo.append((source, link))
+            queued.add(link)
+    print(f"Enrichment: {len(todo)} new links, {len(known)} already enriched")
+    if todo:
+        t0 = time.perf_counter()
+        fetched = fetch_details(todo, concurrency)
+        stamp = datetime.utcnow().isoformat()
+        for link, details in fetched.items():
+            known[link] = {**details, "EnrichedAt": stamp}
+        save_json_atomic(path, known)
+        print(f"Enrichment: fetched {len(fetched)}/{len(todo)} pages in {time.perf_counter() - t0:.1f}s")
+
+    df = df.copy()
+    details = df["Link"].map(lambda link: known.get(link, {}))
+    for field in ENRICH_FIELDS:
+        found = details.map(lambda d: d.get(field))
+        if field in df.columns:
+            # only placeholders are replaced; real listing values win
+            missing = df[field].isna() | df[field].astype(str).str.strip().isin(PLACEHOLDERS)
+            df[field] = df[field].where(~(missing & found.notna()), found)
+        else:
+            df[field] = found
+    df["Mode"] = df["Location"].map(classify_mode)  # locations may have been filled in
+    df["EnrichedAt"] = details.map(lambda d: d.get("EnrichedAt"))
+    return df
+
+pending = STORE.query("SELECT Link, Source, RawDate AS Date, Location, Prize, Deadline"
+                      " FROM hackathons WHERE EnrichedAt IS NULL")
+df_enriched = enrich_listings(pending).rename(columns={"Date": "RawDate"})
+counts = STORE.upsert(df_enriched, ["RawDate", "Location", "Mode", "Prize", "Deadline", "EnrichedAt"])
+print(f"✅ Enriched {len(df_enriched)} rows in {STORE.path}: {counts}")
+df_enriched.head(10)
 
 
 # In[17]:
 
 
+# ------------------------------
+# Cell 10b - Parse dates (vectorized, start/end + confidence)
+# ------------------------------
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
-# Load the scraped CSV
-df = pd.read_csv("hackathons.csv")
+# Load the rows whose date text hasn't been parsed yet (new or changed since the
+# last run); duplicates were already collapsed by the store's canonical link
+df = STORE.query("SELECT Link, RawDate FROM hackathons WHERE DateParsed = 0")
 
-print("Raw rows:", len(df))
+print("Rows to parse:", len(df))
 
 # -------------------------------
-# 1. Drop duplicates
+# 1. Parse dates
 # -------------------------------
-df = df.drop_duplicates(subset=["Title", "Link"])
-print("After dropping duplicates:", len(df))
+# Each source writes dates its own way; every pattern fills the same groups
+# (m1 d1 y1 = start, m2 d2 y2 = end) and runs as one str.extract over the rows
+# no earlier pattern matched:
+#   ISO (detail pages' JSON-LD)  2025-09-13 / 2025-09-13 - 2025-09-15
+#   month first (Devpost, MLH,   Jul 31 - Oct 01, 2025 / Sep 13 - 15, 2025 /
+#   Eventbrite)                  Sat, Sep 13, 2025, 9:00 AM / SEP 26TH - 28TH
+#   day first (Hackathon.com)    13 - 15 Sep 2025 / 30 Sep - 2 Oct 2025
+#   numeric                      09/13/2025 (month first unless that can't be)
+# DateConfidence: 1 = both ends fully given, 0.9 = start year taken from a range
+# crossing new year, 0.6 = no year (next occurrence after `today`), 0.5 = numeric
+# date that reads both ways (03/04/2025, taken month first), halved when the end
+# comes before the start; 0 = no date
+# month names and their abbreviations only, so "Marathon" or "Mayhem" in a title
+# is not read as a month
+_MONTH = (r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+          r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?(?![a-z])")
+_TO = r"\s*(?:-|–|—|to|until)\s*"
+
+def _month(name):
+    return rf"(?P<{name}>{_MONTH})"
+
+def _day(name):
+    return rf"(?P<{name}>\d{{1,2}})(?!\d)(?:st|nd|rd|th)?"
+
+DATE_PATTERNS = [
+    ("iso", 1.0, re.compile(
+        r"(?P<y1>\d{4})-(?P<m1>\d{1,2})-(?P<d1>\d{1,2})"
+        r"(?:[t ]\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?(?:z|[+-]\d{2}:?\d{2})?)?"
+        rf"(?:{_TO}(?P<y2>\d{{4}})-(?P<m2>\d{{1,2}})-(?P<d2>\d{{1,2}}))?", re.I)),
+    ("month_first", 1.0, re.compile(
+        rf"\b{_month('m1')}\s*{_day('d1')}(?:,?\s+(?P<y1>\d{{4}}))?"
+        rf"(?:{_TO}(?:{_month('m2')}\s*)?{_day('d2')})?(?:,?\s+(?P<y2>\d{{4}}))?", re.I)),
+    ("day_first", 1.0, re.compile(
+        rf"\b{_day('d1')}\s*(?:{_month('m1')}\s*)?(?:,?\s*(?P<y1>\d{{4}}))?"
+        rf"(?:{_TO}{_day('d2')}\s*)?{_month('m2')},?\s*(?P<y2>\d{{4}})?", re.I)),
+    ("numeric", 1.0, re.compile(
+        r"\b(?P<m1>\d{1,2})/(?P<d1>\d{1,2})/(?P<y1>\d{4})"
+        rf"(?:{_TO}(?P<m2>\d{{1,2}})/(?P<d2>\d{{1,2}})/(?P<y2>\d{{4}}))?", re.I)),
+]
+MONTH_NUMBERS = {m: k for k, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+
+def _month_numbers(col):
+    return pd.to_numeric(col, errors="coerce").fillna(col.str[:3].str.lower().map(MONTH_NUMBERS))
+
+def _to_dates(year, month, day):
+    return pd.to_datetime(pd.DataFrame({"year": year, "month": month, "day": day}), errors="coerce")
+
+# start/end dates + confidence for the rows one pattern matched
+def _assemble(parts, confidence, today, numeric):
+    m1, m2 = _month_numbers(parts["m1"]), _month_numbers(parts["m2"])
+    d1, d2 = pd.to_numeric(parts["d1"]), pd.to_numeric(parts["d2"])
+    y1, y2 = pd.to_numeric(parts["y1"]), pd.to_numeric(parts["y2"])
+    conf = pd.Series(confidence, index=parts.index)
+    if numeric:  # 13/09/2025 can only be day first, 09/13/2025 only month first
+        swap = (m1 > 12) | (m2 > 12)
+        m1, d1 = m1.mask(swap, d1), d1.mask(swap, m1)
+        m2, d2 = m2.mask(swap, d2), d2.mask(swap, m2)
+        # both orders valid and different: every part <= 12 and month != day
+        ambiguous = (~swap & (d1 <= 12) & (d2.isna() | (d2 <= 12))
+                     & ((m1 != d1) | (m2.notna() & (m2 != d2))))
+        conf = conf.mask(ambiguous, 0.5)
+    single = d2.isna()
+    m1 = m1.fillna(m2)
+    m2, d2 = m2.fillna(m1).mask(single, m1), d2.fillna(d1)
+    y2 = y2.fillna(y1)
+    # the year is written once, after the end: a start month after the end month
+    # means the range crosses new year
+    crosses = y1.isna() & y2.notna() & (m1 > m2)
+    y1 = y1.fillna(y2).mask(crosses, y2 - 1)
+    conf = conf.mask(crosses, np.minimum(conf, 0.9))
+    # no year at all: the next occurrence, allowing events that started recently
+    no_year = y1.isna()
+    guess = today.year + (_to_dates(today.year, m1, d1) < today - pd.Timedelta(days=60)).astype(int)
+    y1 = y1.fillna(guess.where(no_year))
+    y2 = y2.fillna(y1 + (m1 > m2).astype(int))
+    conf = conf.mask(no_year, np.minimum(conf, 0.6))
+    start, end = _to_dates(y1, m1, d1), _to_dates(y2, m2, d2)
+    backwards = end < start
+    end = end.mask(backwards)
+    conf = conf.mask(backwards, conf / 2).where(start.notna(), 0.0)
+    return pd.DataFrame({"StartDate": start, "EndDate": end.where(start.notna()), "DateConfidence": conf})
+
+# -> frame with StartDate, EndDate and DateConfidence aligned with the `raw`
+# Series. Repeated strings are parsed once (listings repeat the same date texts)
+def parse_date_ranges(raw, today=None):
+    today = pd.Timestamp(today or datetime.now()).normalize()
+    codes, uniques = pd.factorize(raw, use_na_sentinel=False)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    parsed = pd.DataFrame({"StartDate": pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]"),
+                           "EndDate": pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]"),
+                           "DateConfidence": 0.0})
+    todo = text.index
+    for name, confidence, pattern in DATE_PATTERNS:
+        if not len(todo):
+            break
+        parts = text[todo].str.extract(pattern)
+        parts = parts[parts["d1"].notna()]
+        if len(parts):
+            found = _assemble(parts, confidence, today, numeric=name == "numeric")
+            found = found[found["StartDate"].notna()]
+            parsed.loc[found.index] = found
+            todo = todo.difference(found.index)
+    return parsed.iloc[codes].set_index(raw.index)
+
+df = df.join(parse_date_ranges(df["RawDate"]))
+print("Valid dates:", int(df["StartDate"].notna().sum()),
+      "| low confidence (< 0.8):", int(((df["DateConfidence"] > 0) & (df["DateConfidence"] < 0.8)).sum()))
 
 # -------------------------------
-# 2. Parse dates & drop invalid ones
+# 2. Save parsed dates (rows without a valid date stay out of the listings)
 # -------------------------------
-def parse_date(x):
-    try:
-        return pd.to_datetime(x, errors="coerce")
-    except:
-        return pd.NaT
-
-df["Date"] = df["Date"].apply(parse_date)
-
-# Drop rows with no valid date
-df = df.dropna(subset=["Date"])
-print("After removing invalid dates:", len(df))
+STORE.set_dates(df)
 
 # -------------------------------
-# 3. Keep only upcoming hackathons
+# 3. Upcoming hackathons, sorted by date
 # -------------------------------
-today = pd.Timestamp(datetime.now().date())
-df = df[df["Date"] >= today]
-print("After filtering past events:", len(df))
+df = STORE.listings(upcoming=True)
+print("✅ Store has", len(df), "upcoming hackathons")
 
-# -------------------------------
-# 4. Sort by date
-# -------------------------------
-df = df.sort_values("Date").reset_index(drop=True)
 
-# -------------------------------
-# 5. Save cleaned CSV
-# -------------------------------
-df.to_csv("clean_hackathons.csv", index=False)
-print("✅ Saved clean_hackathons.csv with", len(df), "upcoming hackathons")
+# In[ ]:
+
+
+# ------------------------------
+# Cell 10c - Cross-source near-duplicate merge (MinHash + LSH)
+# ------------------------------
+# The same event is often listed on Devpost, MLH and Eventbrite with slightly
+# different titles and different links. Every dated row gets a MinHash signature
+# over the character 3-grams of its normalized title; LSH banding puts likely
+# matches in a shared bucket, and inside a bucket only neighbours in date order
+# are compared, so the work grows about linearly with the number of rows. Pairs
+# from different sources whose signatures agree closely and whose dates are a few
+# days apart are joined with union-find. Each cluster keeps one canonical row (the
+# most complete one, gaps filled from the others) that lists every source link;
+# the other rows point at it and drop out of the listings.
+import numpy as np
+
+NEAR_DUP_HASHES = 32
+NEAR_DUP_BANDS = 8          # 8 bands x 4 rows: pairs above ~0.6 similarity usually share a band
+NEAR_DUP_THRESHOLD = 0.6    # share of equal signature positions (estimated Jaccard)
+NEAR_DUP_DATE_DAYS = 3
+NEAR_DUP_SEED = 7
+NEAR_DUP_FIELDS = ["Location", "Mode", "Prize", "Deadline"]
+SOURCE_PRIORITY = ["Devpost", "MLH", "Hackathon.com", "Eventbrite", "AngelHack"]
+# years ("2025", "'25"), ordinals ("2nd") and edition words: one source says
+# "HackMIT 2025", another "HackMIT", and on a short title those few characters
+# alone push the similarity under the threshold. The date check keeps
+# different years of an event apart
+NEAR_DUP_NOISE = r"(?<!\d)(?:19|20)\d{2}(?!\d)|'\d{2}\b|\b\d+(?:st|nd|rd|th)\b|\b(?:annual|edition)\b"
+
+# 3-gram codes of every title in one array; grams crossing into the next title are
+# dropped. Spaces are removed so "Hack MIT" and "HackMIT" shingle the same
+def title_shingles(titles):
+    # normalize_title() (hackathon_store.py) without the spaces or year/edition
+    # tokens, over the whole column
+    clean = (pd.Series(titles, dtype=object).fillna("").astype(str).str.normalize("NFKC")
+             .str.casefold().str.replace(NEAR_DUP_NOISE, " ", regex=True)
+             .str.replace(r"[\W_]+", "", regex=True))
+    encoded = [(" " + t + " ").encode("utf-8") for t in clean]
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.int64)
+    if len(buf) < 3:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(encoded)), lengths)[:-2]
+    grams = (buf[:-2] << 16) | (buf[1:-1] << 8) | buf[2:]
+    keep = np.arange(len(grams)) + 3 <= ends[owner]
+    return grams[keep], owner[keep]
+
+# MinHash signature per row, one multiply-shift hash per slot (rows without
+# shingles keep the max value in every slot)
+def minhash_signatures(grams, owner, n, hashes=NEAR_DUP_HASHES, seed=NEAR_DUP_SEED):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 63, hashes, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, hashes, dtype=np.uint64)
+    sig = np.full((n, hashes), np.iinfo(np.uint32).max, dtype=np.uint32)
+    if len(grams) == 0:
+        return sig
+    grams = grams.astype(np.uint64)
+    starts = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    rows = owner[starts]
+    shift = np.uint64(32)
+    for k in range(hashes):
+        sig[rows, k] = np.minimum.reduceat(((a[k] * grams + b[k]) >> shift).astype(np.uint32), starts)
+    return sig
+
+# candidate pairs from LSH banding: rows are sorted by (band key, day) and each
+# row is paired with the next one in the same bucket -> (i, j) arrays
+def lsh_candidates(sig, days, rows, bands=NEAR_DUP_BANDS, seed=NEAR_DUP_SEED):
+    width = sig.shape[1] // bands
+    mult = np.random.default_rng(seed + 1).integers(1, 1 << 62, width, dtype=np.uint64)
+    firsts, seconds = [], []
+    for band in range(bands):
+        keys = (sig[rows, band * width:(band + 1) * width].astype(np.uint64) * mult).sum(axis=1)
+        perm = np.lexsort((days[rows], keys))
+        order, keys = rows[perm], keys[perm]
+        same = np.flatnonzero(keys[1:] == keys[:-1])
+        firsts.append(order[same])
+        seconds.append(order[same + 1])
+    i, j = np.concatenate(firsts), np.concatenate(seconds)
+    pair = np.unique(np.minimum(i, j) * len(sig) + np.maximum(i, j))
+    return pair // len(sig), pair % len(sig)
+
+def union_find(pairs):
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    for i, j in pairs:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+    clusters = {}
+    for x in list(parent):
+        clusters.setdefault(find(x), []).append(x)
+    for root in clusters:
+        clusters[root].append(root)
+    return list(clusters.values())
+
+# -> list of clusters (lists of row positions in `df`) of the same event across sources
+def find_near_duplicates(df, threshold=NEAR_DUP_THRESHOLD, date_days=NEAR_DUP_DATE_DAYS):
+    n = len(df)
+    if n < 2:
+        return []
+    dates = pd.to_datetime(df["Date"], errors="coerce")
+    days = dates.values.astype("datetime64[D]").astype(np.int64)
+    grams, owner = title_shingles(df["Title"].tolist())
+    sig = minhash_signatures(grams, owner, n)
+    rows = np.intersect1d(np.unique(owner), np.flatnonzero(dates.notna().values))
+    i, j = lsh_candidates(sig, days, rows)
+    sources = df["Source"].to_numpy(dtype=object)
+    ok = ((sources[i] != sources[j])
+          & (np.abs(days[i] - days[j]) <= date_days)
+          & ((sig[i] == sig[j]).mean(axis=1) >= threshold))
+    return union_find(zip(i[ok].tolist(), j[ok].tolist()))
+
+# orders each cluster: the most complete member first, then by source priority
+def rank_clusters(df, clusters):
+    filled = df[NEAR_DUP_FIELDS].notna().sum(axis=1).to_numpy()
+    priority = df["Source"].map({s: k for k, s in enumerate(SOURCE_PRIORITY)}).fillna(len(SOURCE_PRIORITY)).to_numpy()
+    return [sorted(members, key=lambda m: (-filled[m], priority[m])) for members in clusters]
+
+# finds the clusters among the dated rows of the store, fills gaps of each
+# canonical row from its copies and records the clusters
+def merge_near_duplicates(store=STORE):
+    df = store.query("SELECT Link, Source, Title, Date, " + ", ".join(NEAR_DUP_FIELDS) +
+                     " FROM hackathons WHERE Date IS NOT NULL")
+    t0 = time.perf_counter()
+    clusters = rank_clusters(df, find_near_duplicates(df))
+    elapsed = time.perf_counter() - t0
+    values = {col: df[col].tolist() for col in ["Link", "Source"] + NEAR_DUP_FIELDS}
+    merged = []
+    for members in clusters:
+        row = {"Link": values["Link"][members[0]]}
+        for col in NEAR_DUP_FIELDS:
+            row[col] = next((values[col][m] for m in members if values[col][m] is not None), None)
+        merged.append(row)
+    if merged:
+        store.upsert(pd.DataFrame(merged), NEAR_DUP_FIELDS)
+    store.set_clusters([[(values["Source"][m], values["Link"][m]) for m in members] for members in clusters])
+    dropped = sum(len(m) - 1 for m in clusters)
+    print(f"[near-dup] {len(df)} rows -> {len(clusters)} clusters, {dropped} duplicates folded"
+          f" ({elapsed:.2f}s)")
+    return clusters
+
+near_dup_clusters = merge_near_duplicates()
 
 
 # In[20]:
@@ -562,7 +3001,7 @@ print("✅ Saved clean_hackathons.csv with", len(df), "upcoming hackathons")
 # === PREVIEW & EXPLORE CLEAN DATA ===
 import pandas as pd
 
-df = pd.read_csv("clean_hackathons.csv")
+df = STORE.listings(upcoming=True)
 
 print("Total upcoming hackathons:", len(df))
 
@@ -583,8 +3022,8 @@ print(df.sort_values("Date").tail(1)[["Title", "Date", "Link"]])
 import pandas as pd
 from datetime import datetime
 
-# Load clean data
-df = pd.read_csv("clean_hackathons.csv")
+# Load upcoming hackathons from the store
+df = STORE.listings(upcoming=True)
 
 # Ensure Date is datetime
 df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
@@ -597,22 +3036,16 @@ df["Month"] = df["Date"].dt.month_name()
 today = datetime.now()
 df["DaysLeft"] = (df["Date"] - today).dt.days
 
-# Online / Offline detection (very basic)
-def classify_location(loc):
-    if pd.isna(loc):
-        return "Unknown"
-    loc_str = str(loc).lower()
-    if "online" in loc_str or "virtual" in loc_str:
-        return "Online"
-    else:
-        return "Offline"
-
-df["Mode"] = df["Location"].apply(classify_location)
+# Online / Offline detection (shared with the Hackathon record, Cell 3m)
+df["Mode"] = df["Location"].map(classify_mode)
 
-# Save enriched dataset
+# Export for the analytics cells below, the app and the dashboard: the CSV for
+# anyone who wants plain text, the Parquet snapshot (categoricals + timestamps)
+# for the readers here, which load only the columns they use
 df.to_csv("hackathons_final.csv", index=False)
+write_snapshot(df)
 
-print("✅ Enriched dataset saved as hackathons_final.csv")
+print("✅ Enriched dataset exported as hackathons_final.csv and", SNAPSHOT_PATH)
 print(df.head())
 
 
@@ -622,8 +3055,8 @@ print(df.head())
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Load enriched dataset
-df = pd.read_csv("hackathons_final.csv")
+# Load enriched dataset (only the plotted columns)
+df = load_snapshot(columns=["Source", "Month", "DaysLeft", "Mode"])
 
 # 1️⃣ Hackathons by Source
 plt.figure(figsize=(6,4))
@@ -663,8 +3096,8 @@ plt.show()
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Load enriched dataset
-df = pd.read_csv("hackathons_final.csv")
+# Load enriched dataset (plotted columns + the ones the tables below show)
+df = load_snapshot(columns=["Title", "Date", "Location", "Mode", "Source", "Link", "Month", "DaysLeft"])
 
 # Create dashboard with subplots
 fig, axs = plt.subplots(2, 2, figsize=(12, 10))
@@ -769,7 +3202,7 @@ import plotly.graph_objects as go
 from datetime import datetime
 
 # Load enriched dataset
-df = pd.read_csv("hackathons_final.csv")
+df = load_snapshot(columns=["Title", "Date", "Location", "Mode", "Source", "Link", "Month", "DaysLeft"])
 
 # ===== 1️⃣ Dashboard: 4 plots =====
 fig, axs = plt.subplots(2, 2, figsize=(12, 10))
@@ -823,5 +3256,464 @@ table_fig.show()
 # In[ ]:
 
 
+# ------------------------------
+# Cell 11 - Scraper benchmark on snapshot pages
+# ------------------------------
+# Serves snapshots of the five listing sites from a local HTTP server, runs each
+# scraper against them and reports pages/sec, records/sec, peak RSS (Python, and
+# Chrome when a source needed it) and time spent waiting (page_load +
+# readiness_wait stages) vs extracting. Results are written to
+# benchmarks/results/*.json; check_benchmark_regressions() compares a run with
+# benchmarks/baseline.json so CI can flag slowdowns. benchmarks/run_benchmark.py
+# runs the same harness without the notebook's live scrape.
+#
+# The pages come from benchmarks/snapshots/ once record_benchmark_snapshots()
+# has copied a real crawl there. Until then benchmarks/synthetic/ is used:
+# hand-built pages that only follow each scraper's selectors. Their Devpost
+# pages build the cards in JavaScript like the real site, so that source goes
+# through Chrome; without Chrome it is reported as failed and left out.
+import http.server
+import shutil
+import tempfile
+import platform
+import urllib.parse
+import psutil
+
+RUN_BENCHMARK = False  # set to True to run it when executing the notebook
+
+BENCH_DIR = "benchmarks"
+BENCH_SNAPSHOTS = os.path.join(BENCH_DIR, "snapshots")
+BENCH_SYNTHETIC = os.path.join(BENCH_DIR, "synthetic")
+BENCH_RESULTS = os.path.join(BENCH_DIR, "results")
+BENCH_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+BENCH_SLUGS = {
+    "Devpost": "devpost",
+    "MLH": "mlh",
+    "Hackathon.com": "hackathoncom",
+    "Eventbrite": "eventbrite",
+    "AngelHack": "angelhack",
+}
+BENCH_JOBS = {
+    "Devpost": lambda: scrape_devpost(max_pages=5),
+    "MLH": lambda: mlh_scraper(),
+    "Hackathon.com": lambda: hackathoncom_scraper(max_pages=3),
+    "Eventbrite": lambda: eventbrite_scraper(max_pages=2),
+    "AngelHack": lambda: scrape_angelhack(),
+}
+BENCH_MAX_PAGES = {"Devpost": 5, "MLH": 1, "Hackathon.com": 3, "Eventbrite": 2, "AngelHack": 1}
+
+def _path_and_query(url):
+    parts = urllib.parse.urlsplit(url)
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+# copies the listing pages of the last crawl out of the page cache (Cell 3g);
+# a browser-rendered copy wins over static HTML since that's what the scraper used
+def record_benchmark_snapshots(dest=BENCH_SNAPSHOTS):
+    manifest = load_json(os.path.join(dest, "manifest.json"), {})
+    for e in os.scandir(os.path.join(PAGE_CACHE.root, "entries")):
+        entry = load_json(e.path, None)
+        slug = BENCH_SLUGS.get(entry["source"]) if entry else None
+        if slug is None:
+            continue
+        pages = manifest.setdefault(slug, {})
+        key = _path_and_query(entry["url"])
+        if key in pages and entry["kind"] != "rendered":
+            continue
+        os.makedirs(os.path.join(dest, slug), exist_ok=True)
+        name = entry["body"] + ".html"
+        shutil.copyfile(PAGE_CACHE._body_path(entry["body"]), os.path.join(dest, slug, name))
+        pages[key] = name
+    save_json_atomic(os.path.join(dest, "manifest.json"), manifest)
+    return {slug: len(pages) for slug, pages in manifest.items()}
+
+
+# (root, "recorded" | "synthetic") of the pages the benchmark replays
+def bench_pages():
+    if os.path.exists(os.path.join(BENCH_SNAPSHOTS, "manifest.json")):
+        return BENCH_SNAPSHOTS, "recorded"
+    return BENCH_SYNTHETIC, "synthetic"
+
+
+class _SnapshotHandler(http.server.BaseHTTPRequestHandler):
+    root = BENCH_SNAPSHOTS
+    manifest = {}
+    served = None  # set of listing paths handed out, when the caller wants them
+
+    def do_GET(self):
+        slug, _, rest = self.path.lstrip("/").partition("/")
+        name = self.manifest.get(slug, {}).get("/" + rest)
+        if name is None:
+            self.send_error(404)
+            return
+        if self.served is not None:
+            self.served.add(self.path)
+        with open(os.path.join(self.root, slug, name), "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+# yields the base URL of a local server that replays the benchmark pages;
+# `served` (a set) collects the listing paths it answered
+@contextmanager
+def serve_snapshots(root=None, served=None):
+    root = root or bench_pages()[0]
+    manifest = load_json(os.path.join(root, "manifest.json"), {})
+    handler = type("SnapshotHandler", (_SnapshotHandler,), {"root": root, "manifest": manifest, "served": served})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _RssSampler:
+    # samples the peak RSS of this process and of its children (chromedriver + Chrome)
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak_python = 0
+        self.peak_chrome = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        proc = psutil.Process()
+        while not self._stop.is_set():
+            self.peak_python = max(self.peak_python, proc.memory_info().rss)
+            chrome = 0
+            for child in proc.children(recursive=True):
+                try:
+                    chrome += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            self.peak_chrome = max(self.peak_chrome, chrome)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+# circuit breakers for one benchmark run: all closed, and apart from scrape_state/
+def bench_breakers(name="breakers.json"):
+    path = os.path.join(BENCH_RESULTS, name)
+    if os.path.exists(path):
+        os.remove(path)
+    return CircuitBreakers(path)
+
+# each source is crawled `repeat` times and the fastest crawl is reported: the
+# local pages load in milliseconds, so a single crawl is mostly noise. pages
+# counts the listing pages the server handed out, so a page read over HTTP and
+# then rendered in Chrome counts once. A source whose crawl raises (no Chrome
+# for a client-rendered page) is reported with its error instead of numbers
+def run_benchmark(sources=None, label="", save=True, repeat=5):
+    global DRIVER_POOL, CACHE_MODE, CHECKPOINTS, BREAKERS, SCHEDULER
+    sources = sources or list(BENCH_JOBS)
+    saved_pool, saved_urls, saved_mode = DRIVER_POOL, dict(SOURCE_URLS), CACHE_MODE
+    saved_checkpoints, saved_breakers, saved_scheduler = CHECKPOINTS, BREAKERS, SCHEDULER
+    CACHE_MODE = "off"  # measure the scrapers, not the page cache
+    DRIVER_POOL = DriverPool(size=DRIVER_POOL.size, headless=True)
+    # full crawls every time, and the real crawl's resume points and breakers
+    # stay untouched
+    CHECKPOINTS = CrawlCheckpoints(os.path.join(BENCH_RESULTS, "checkpoints.json"))
+    BREAKERS = bench_breakers()
+    results, served = {}, set()
+    root, kind = bench_pages()
+    try:
+        with serve_snapshots(root, served) as local:
+            for source in sources:
+                SOURCE_URLS[source] = local + "/" + BENCH_SLUGS[source] + _path_and_query(saved_urls[source])
+                best = None
+                try:
+                    with _RssSampler() as rss:
+                        for _ in range(repeat):
+                            METRICS.reset()
+                            start_run_guards()
+                            served.clear()
+                            SCHEDULER = unthrottled_scheduler()  # the local server needs no politeness
+                            t0 = time.perf_counter()
+                            records = sum(1 for _ in BENCH_JOBS[source]())
+                            elapsed = time.perf_counter() - t0
+                            if best is None or elapsed < best[0]:
+                                best = (elapsed, records, len(served), [METRICS.get(stage, source) for stage in
+                                                                        ("page_load", "readiness_wait", "extraction")])
+                except Exception as e:
+                    results[source] = {"error": repr(e)}
+                    print(f"[bench] {source} failed: {e!r}")
+                    continue
+                elapsed, records, pages, (load, ready, extract) = best
+                results[source] = {
+                    "seconds": round(elapsed, 3),
+                    "pages": pages,
+                    "records": records,
+                    "pages_per_sec": round(pages / elapsed, 3) if elapsed else 0.0,
+                    "records_per_sec": round(records / elapsed, 3) if elapsed else 0.0,
+                    "wait_seconds": round(load["seconds"] + ready["seconds"], 3),
+                    "extract_seconds": round(extract["seconds"], 3),
+                    "peak_rss_python_mb": round(rss.peak_python / 2**20, 1),
+                }
+                if rss.peak_chrome:
+                    results[source]["peak_rss_chrome_mb"] = round(rss.peak_chrome / 2**20, 1)
+                print(f"[bench] {source}: {results[source]}")
+    finally:
+        SOURCE_URLS.update(saved_urls)
+        CACHE_MODE = saved_mode
+        CHECKPOINTS, BREAKERS, SCHEDULER = saved_checkpoints, saved_breakers, saved_scheduler
+        DRIVER_POOL.close()
+        DRIVER_POOL = saved_pool
+    out = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "label": label,
+        "python": platform.python_version(),
+        "machine": f"{platform.platform()}, {os.cpu_count()} CPUs",
+        "snapshots": kind,
+        "results": results,
+    }
+    if save:
+        os.makedirs(BENCH_RESULTS, exist_ok=True)
+        path = os.path.join(BENCH_RESULTS, datetime.utcnow().strftime("%Y%m%dT%H%M%S") + ".json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(out, f, indent=2)
+        print("[bench] results saved to", path)
+    return out
+
+# compares a run with the stored baseline; returns a list of regressions
+# (throughput down or time / memory up by more than `tolerance`, or a source
+# that ran in the baseline failing now). Speed only counts as regressed when the
+# crawl also got `noise_seconds` slower: a source that takes a few milliseconds
+# swings by more than 20% on its own. A baseline taken on the other set of
+# pages (synthetic vs recorded) can't be compared with
+def check_benchmark_regressions(run, baseline_path=BENCH_BASELINE, tolerance=0.2, noise_seconds=0.05):
+    baseline = load_json(baseline_path, None)
+    if baseline is None:
+        print("[bench] no baseline at", baseline_path)
+        return []
+    if baseline.get("snapshots") != run.get("snapshots"):
+        print(f"[bench] baseline is from {baseline.get('snapshots')} pages, this run used "
+              f"{run.get('snapshots')} pages: record a new baseline")
+        return []
+    if baseline.get("machine") != run.get("machine"):
+        print(f"[bench] baseline was taken on {baseline.get('machine')}, timings may not compare")
+    speed = ["pages_per_sec", "records_per_sec"]
+    memory = ["peak_rss_python_mb", "peak_rss_chrome_mb"]
+    regressions = []
+    for source, cur in run["results"].items():
+        base = baseline["results"].get(source)
+        if not base or "error" in base:
+            continue
+        if "error" in cur:
+            regressions.append(f"{source}: {cur['error']}")
+            continue
+        slower = cur["seconds"] - base["seconds"] > noise_seconds
+        higher_is_better = speed if slower else []
+        lower_is_better = (["seconds"] if slower else []) + memory
+        for k in higher_is_better:
+            if base.get(k) and cur[k] < base[k] * (1 - tolerance):
+                regressions.append(f"{source} {k}: {base[k]} -> {cur[k]}")
+        for k in lower_is_better:
+            if base.get(k) and cur.get(k, 0) > base[k] * (1 + tolerance):
+                regressions.append(f"{source} {k}: {base[k]} -> {cur[k]}")
+    for r in regressions:
+        print("[bench] REGRESSION", r)
+    return regressions
+
+# work queue (Cell 8b) throughput per worker count on the benchmark pages, with
+# the rate limits lifted so the workers are what's measured
+def benchmark_queue_scaling(worker_counts=(1, 2, 4, 8)):
+    global BREAKERS
+    saved_urls, saved_breakers = dict(SOURCE_URLS), BREAKERS
+    BREAKERS = bench_breakers("queue_breakers.json")
+    try:
+        with serve_snapshots() as local:
+            for source in BENCH_MAX_PAGES:
+                SOURCE_URLS[source] = local + "/" + BENCH_SLUGS[source] + _path_and_query(saved_urls[source])
+            return measure_queue_scaling(BENCH_MAX_PAGES, worker_counts, throttle=False,
+                                         path=os.path.join(BENCH_RESULTS, "queue_scaling.db"))
+    finally:
+        SOURCE_URLS.update(saved_urls)
+        BREAKERS = saved_breakers
+
+# bytes transferred and page-load time per source with and without request
+# blocking: each page is rendered `repeat` times under every profile, with
+# Chrome's HTTP cache off so every load (and every profile) pays for its own
+# requests. The synthetic pages have no images, fonts or trackers of their
+# own, so the numbers that matter come from live=True, which renders the real
+# listing pages (rate-limited as in a scrape)
+def compare_browser_profiles(sources=None, profiles=("full", "lean"), repeat=3, live=False):
+    global DRIVER_POOL, CACHE_MODE, CAPTURE_NETWORK_LOG, SCHEDULER
+    sources = sources or list(BENCH_JOBS)
+    saved = DRIVER_POOL, dict(SOURCE_URLS), CACHE_MODE, CAPTURE_NETWORK_LOG, SCHEDULER
+    CACHE_MODE, CAPTURE_NETWORK_LOG = "off", True
+    if not live:
+        SCHEDULER = unthrottled_scheduler()
+    DRIVER_POOL = DriverPool(size=1, headless=True)
+    rows = []
+    try:
+        with (nullcontext() if live else serve_snapshots()) as local, DriverLease() as lease:
+            driver = lease.get()
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+            for source in sources:
+                url = saved[1][source] if live else local + "/" + BENCH_SLUGS[source] + _path_and_query(saved[1][source])
+                for profile in profiles:
+                    start_run_guards()
+                    loads = []
+                    for _ in range(repeat):
+                        t0 = time.perf_counter()
+                        cards, info, _ = render_cards(url, source, lease, profile)
+                        loads.append((time.perf_counter() - t0, len(cards), info.get("transfer", {})))
+                    n = len(loads)
+                    rows.append({
+                        # applied differs from profile when Chrome rejected the blocking calls
+                        "source": source, "profile": profile, "applied": info["profile"], "cards": loads[-1][1],
+                        "kb": round(sum(t.get("bytes", 0) for _, _, t in loads) / n / 1024, 1),
+                        "requests": round(sum(t.get("requests", 0) for _, _, t in loads) / n, 1),
+                        "blocked": round(sum(t.get("blocked", 0) for _, _, t in loads) / n, 1),
+                        "load_ms": round(sum(t.get("load_ms") or 0 for _, _, t in loads) / n),
+                        "seconds": round(sum(sec for sec, _, _ in loads) / n, 3),
+                    })
+                    print(f"[bench] {rows[-1]}")
+    finally:
+        DRIVER_POOL.close()
+        DRIVER_POOL, urls, CACHE_MODE, CAPTURE_NETWORK_LOG, SCHEDULER = saved
+        SOURCE_URLS.update(urls)
+    return pd.DataFrame(rows)
+
+
+# load time and memory of the enriched export as CSV vs the Parquet snapshot:
+# the export is tiled to `rows` rows, then each reader loads the columns the
+# analytics cells use (CSV also has to parse dates; the snapshot has them typed)
+SNAPSHOT_BENCH_COLUMNS = ["Title", "Date", "Location", "Mode", "Source", "Link", "Month", "DaysLeft"]
+
+def compare_snapshot_formats(rows=200_000, repeat=3, columns=SNAPSHOT_BENCH_COLUMNS):
+    base = pd.read_csv("hackathons_final.csv")
+    df = pd.concat([base] * (rows // len(base) + 1), ignore_index=True).head(rows)
+    tmp = tempfile.mkdtemp(prefix="snapshot-bench-")
+    csv_path = os.path.join(tmp, "hackathons.csv")
+    parquet_path = os.path.join(tmp, "hackathons.parquet")
+    df.to_csv(csv_path, index=False)
+    write_snapshot(df, parquet_path)
+
+    def read_csv():
+        out = pd.read_csv(csv_path, usecols=columns)
+        out["Date"] = pd.to_datetime(out["Date"], errors="coerce")
+        return out
+
+    readers = {"csv": (csv_path, read_csv),
+               "parquet": (parquet_path, lambda: load_snapshot(columns, parquet_path))}
+    out = []
+    try:
+        for name, (path, read) in readers.items():
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                loaded = read()
+                times.append(time.perf_counter() - t0)
+            out.append({"format": name, "rows": len(loaded),
+                        "file_mb": round(os.path.getsize(path) / 2**20, 2),
+                        "load_seconds": round(min(times), 3),
+                        "memory_mb": round(loaded.memory_usage(deep=True).sum() / 2**20, 1)})
+            print(f"[bench] {out[-1]}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return pd.DataFrame(out)
+
+
+# near-duplicate detection (Cell 10c) on synthetic listings: `rows` / 3 events,
+# each listed by three sources with title variants and dates a day apart
+def benchmark_near_duplicates(rows=300_000, seed=1):
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    vocab = ["".join(rng.choice(letters, rng.integers(3, 10))) for _ in range(5000)]
+    events = rows // 3
+    titles = [" ".join(words) + " hackathon" for words in rng.choice(vocab, (events, 3))]
+    days = rng.integers(0, 365, events)
+    df = pd.DataFrame({
+        "Source": np.repeat([["Devpost", "MLH", "Eventbrite"]], events, axis=0).ravel(),
+        "Title": [t if k % 3 == 0 else (t.title() + " 2025" if k % 3 == 1 else t.upper() + "!")
+                  for t in titles for k in range(3)],
+        "Date": pd.to_datetime("2025-01-01") + pd.to_timedelta(np.repeat(days, 3) + np.tile([0, 1, 0], events), "D"),
+    })
+    t0 = time.perf_counter()
+    clusters = find_near_duplicates(df)
+    elapsed = time.perf_counter() - t0
+    exact = sum(1 for c in clusters if len(c) == 3 and len({m // 3 for m in c}) == 1)
+    out = {"rows": len(df), "seconds": round(elapsed, 2), "rows_per_sec": round(len(df) / elapsed),
+           "clusters": len(clusters), "exact_clusters": exact, "events": events}
+    print(f"[bench] {out}")
+    return out
+
+
+# the date parser Cell 10b used before parse_date_ranges()
+def parse_date_apply(x):
+    try:
+        return pd.to_datetime(x, errors="coerce")
+    except:
+        return pd.NaT
+
+# `rows` synthetic date strings in every source's format
+def synthetic_date_strings(rows, seed=1):
+    rng = np.random.default_rng(seed)
+    start = pd.to_datetime("2025-01-01") + pd.to_timedelta(rng.integers(0, 730, rows), "D")
+    end = start + pd.to_timedelta(rng.integers(0, 60, rows), "D")
+    formats = [lambda s, e: s.strftime("%b %d - ") + e.strftime("%b %d, %Y"),           # Devpost
+               lambda s, e: s.strftime("%b %d").str.upper() + e.strftime(" - %dTH").str.upper(),  # MLH
+               lambda s, e: s.strftime("%d %b %Y"),                                     # Hackathon.com
+               lambda s, e: s.strftime("%a, %b %d, %Y, 9:00 AM"),                       # Eventbrite
+               lambda s, e: s.strftime("%Y-%m-%d - ") + e.strftime("%Y-%m-%d"),          # JSON-LD
+               lambda s, e: pd.Index(["See website"] * len(s))]
+    which = rng.integers(0, len(formats), rows)
+    out = np.empty(rows, dtype=object)
+    for k, fmt in enumerate(formats):
+        idx = np.flatnonzero(which == k)
+        out[idx] = np.asarray(fmt(start[idx], end[idx]), dtype=object)
+    return pd.Series(out)
+
+# throughput of parse_date_ranges() on `rows` strings vs the old row-by-row
+# .apply(pd.to_datetime), timed on `apply_rows` of them and scaled up
+def benchmark_date_parsing(rows=1_000_000, apply_rows=50_000):
+    raw = synthetic_date_strings(rows)
+    t0 = time.perf_counter()
+    parsed = parse_date_ranges(raw)
+    vectorized = time.perf_counter() - t0
+    sample = raw.head(apply_rows)
+    t0 = time.perf_counter()
+    applied = sample.apply(parse_date_apply)
+    per_row = (time.perf_counter() - t0) / len(sample)
+    out = {"rows": rows, "unique_strings": int(raw.nunique()),
+           "vectorized_seconds": round(vectorized, 2), "vectorized_rows_per_sec": round(rows / vectorized),
+           "apply_rows_per_sec": round(1 / per_row), "apply_seconds_est": round(per_row * rows, 1),
+           "speedup": round(per_row * rows / vectorized, 1),
+           "parsed": round(float(parsed["StartDate"].notna().mean()), 3),
+           "apply_parsed": round(float(applied.notna().mean()), 3),
+           "ranges": round(float((parsed["EndDate"] > parsed["StartDate"]).mean()), 3)}
+    print(f"[bench] {out}")
+    return out
+
+
+if RUN_BENCHMARK:
+    bench = run_benchmark()
+    check_benchmark_regressions(bench)
+    print(benchmark_queue_scaling())
+    print(compare_browser_profiles())
+    print(compare_snapshot_formats())
+    benchmark_near_duplicates()
+    benchmark_date_parsing()
+
+
+# In[ ]:
+
+
 
 
@@ -1,24 +1,36 @@
 from flask import Flask, render_template
-import pandas as pd
+from hackathon_store import HackathonStore, load_snapshot
 
 app = Flask(__name__)
 
+# upcoming hackathons come from the Parquet snapshot written by the notebook;
+# without one they're queried from the SQLite store, which a fresh deploy seeds
+# from the committed CSV export
+store = HackathonStore()
+store.seed_from_csv('hackathons_final.csv')
+
+COLUMNS = ['Title', 'Date', 'Location', 'Mode', 'Source', 'Link', 'ScrapedAt']
+
+def load_hackathons():
+    df = load_snapshot(columns=COLUMNS)
+    if df is None:
+        # Date is stored as YYYY-MM-DD text
+        return store.listings(columns=COLUMNS, upcoming=True)
+    # the template slices Date and ScrapedAt as text
+    df = df.sort_values('Date').astype({'Mode': object, 'Source': object})
+    df['Date'] = df['Date'].dt.strftime('%Y-%m-%d')
+    df['ScrapedAt'] = df['ScrapedAt'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    return df
+
 @app.route('/')
 def index():
-    # Read hackathon data
-    df = pd.read_csv('hackathons_final.csv')
-
-    # Ensure Date and ScrapedAt are in string format
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce').astype(str)
-    if 'ScrapedAt' in df.columns:
-        df['ScrapedAt'] = pd.to_datetime(df['ScrapedAt'], errors='coerce').astype(str)
-    else:
-        df['ScrapedAt'] = ''
+    # Load hackathon data
+    df = load_hackathons()
 
-    # Fill missing columns
+    # Fill missing values
+    df['ScrapedAt'] = df['ScrapedAt'].fillna('')
     for col in ['Location','Mode','Source','Title','Link']:
-        if col not in df.columns:
-            df[col] = 'Unknown'
+        df[col] = df[col].fillna('Unknown')
 
     # Convert dataframe to list of dicts for template
     hackathons = df.to_dict(orient='records')
@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scraper"))
+from notebook import load_notebook
+
+# Runs the scraper benchmark of the notebook (Cell 11) against the pages in
+# benchmarks/snapshots/ (recorded from a crawl) or, until some are recorded, the
+# synthetic ones in benchmarks/synthetic/, and compares it with
+# benchmarks/baseline.json.
+# Exits with status 1 when a metric regressed by more than the tolerance, so CI
+# can run it as a check:
+#
+#   python benchmarks/run_benchmark.py
+#   python benchmarks/run_benchmark.py --update-baseline   # after an intended change
+#   python benchmarks/run_benchmark.py --browser-profiles --live
+#
+# The baseline is machine specific: record it on the machine that runs the check.
+# The browser comparison renders pages in Chrome (the benchmark ones, or the
+# real listings with --live) and save their tables next to the scraper
+# results; it is not part of the check.
+
+
+def save_table(nb, name, table):
+    os.makedirs(nb["BENCH_RESULTS"], exist_ok=True)
+    path = os.path.join(nb["BENCH_RESULTS"], f"{name}-{datetime.utcnow():%Y%m%dT%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(table.to_dict(orient="records"), f, indent=2)
+    print(table.to_string(index=False))
+    print("[bench]", name, "saved to", path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper benchmark on snapshot listing pages")
+    parser.add_argument("--sources", nargs="+", help="sources to run (default: all five)")
+    parser.add_argument("--label", default="", help="stored with the results")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown, as a fraction")
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--browser-profiles", action="store_true",
+                        help="bytes and load time per source with and without request blocking")
+    parser.add_argument("--live", action="store_true",
+                        help="--browser-profiles on the real listing pages instead of the benchmark pages")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)  # the notebook's benchmarks/ and scrape_state/ paths are relative
+    nb = load_notebook(extra=("11",))
+    if args.browser_profiles:
+        save_table(nb, "browser_profiles", nb["compare_browser_profiles"](args.sources, live=args.live))
+        return 0
+    run = nb["run_benchmark"](args.sources, label=args.label)
+    if args.update_baseline:
+        with open(nb["BENCH_BASELINE"], "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+            f.write("\n")
+        print("[bench] baseline saved to", nb["BENCH_BASELINE"])
+        return 0
+    regressions = nb["check_benchmark_regressions"](run, tolerance=args.tolerance)
+    print("[bench]", f"{len(regressions)} regression(s)" if regressions else "no regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
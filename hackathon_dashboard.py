@@ -1,20 +1,35 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from hackathon_store import HackathonStore, load_snapshot
+
+# --- Page config (must be the first Streamlit call) ---
+st.set_page_config(page_title="Hackathon Dashboard", layout="wide")
+st.title("🚀 Hackathon Dashboard")
 
 # --- Load dataset ---
-df = pd.read_csv("hackathons_final.csv")
+# the Parquet snapshot (typed dates, categorical Source/Mode/Month) when the
+# notebook has written one, else the upcoming rows of the SQLite store; cached
+# so filter changes (which rerun this script) don't reload it
+COLUMNS = ["Title", "Date", "Location", "Mode", "Source", "Link", "ScrapedAt", "Year", "Month"]
 
-# Ensure proper datetime
-df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-df["Year"] = df["Date"].dt.year
-df["Month"] = df["Date"].dt.month_name()
-df["DaysLeft"] = (df["Date"] - datetime.now()).dt.days
-df["Mode"] = df["Mode"].fillna("Unknown")
+@st.cache_data(ttl=300)
+def load_hackathons():
+    df = load_snapshot(columns=COLUMNS)
+    if df is not None:
+        return df
+    store = HackathonStore()
+    store.seed_from_csv("hackathons_final.csv")
+    df = store.listings(upcoming=True)
+    # Ensure proper datetime
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df["Year"] = df["Date"].dt.year
+    df["Month"] = df["Date"].dt.month_name()
+    df["Mode"] = df["Mode"].fillna("Unknown")
+    return df
 
-# --- Page config ---
-st.set_page_config(page_title="Hackathon Dashboard", layout="wide")
-st.title("🚀 Hackathon Dashboard")
+df = load_hackathons().copy()
+df["DaysLeft"] = (df["Date"] - datetime.now()).dt.days
 
 # --- Sidebar Filters ---
 st.sidebar.header("Filters")
@@ -0,0 +1,357 @@
+import os
+import re
+import json
+import hashlib
+import sqlite3
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote
+
+import pandas as pd
+
+# SQLite store shared by the scraper notebook, app.py and hackathon_dashboard.py.
+# One row per event, keyed by its canonical link; every pipeline stage upserts
+# the rows it touched instead of rewriting a CSV.
+DB_PATH = os.environ.get("HACKATHON_DB", "hackathons.db")
+
+# typed columnar copy of the enriched export (Parquet via pyarrow): repetitive
+# text columns are dictionary-encoded categoricals and dates are real
+# timestamps, so readers load only the columns they need and skip date parsing
+SNAPSHOT_PATH = os.environ.get("HACKATHON_SNAPSHOT", "hackathons_final.parquet")
+SNAPSHOT_CATEGORIES = ["Source", "Mode", "Month"]
+SNAPSHOT_TIMESTAMPS = ["Date", "EndDate", "ScrapedAt"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+# RawDate is the date text as scraped; Date / EndDate are the parsed ISO start and
+# end dates (YYYY-MM-DD) and DateConfidence how sure the parser was (0-1), filled
+# in by the cleaning stage (DateParsed = 1 once it has looked at RawDate).
+# Near-duplicate listings of one event point at its canonical row (DuplicateOf);
+# the canonical row keeps every copy's [Source, Link] in SourceLinks (JSON)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hackathons (
+    Link TEXT PRIMARY KEY,
+    Source TEXT,
+    Title TEXT,
+    RawDate TEXT,
+    Date TEXT,
+    EndDate TEXT,
+    DateConfidence REAL,
+    DateParsed INTEGER NOT NULL DEFAULT 0,
+    Location TEXT,
+    Mode TEXT,
+    Prize TEXT,
+    Deadline TEXT,
+    ScrapedAt TEXT,
+    EnrichedAt TEXT,
+    UpdatedAt TEXT,
+    DuplicateOf TEXT,
+    SourceLinks TEXT
+);
+CREATE INDEX IF NOT EXISTS hackathons_date ON hackathons (Date);
+CREATE INDEX IF NOT EXISTS hackathons_source ON hackathons (Source);
+CREATE INDEX IF NOT EXISTS hackathons_mode ON hackathons (Mode);
+"""
+COLUMNS = ["Link", "Source", "Title", "RawDate", "Date", "EndDate", "DateConfidence", "DateParsed",
+           "Location", "Mode", "Prize", "Deadline", "ScrapedAt", "EnrichedAt", "UpdatedAt",
+           "DuplicateOf", "SourceLinks"]
+
+# listing values that mean "not known"; stored as NULL so they never overwrite real data
+PLACEHOLDERS = {"", "N/A", "See website", "Varies", "Unknown", "nan", "NaT", "None"}
+
+# query parameters that only track where a click came from
+TRACKING_PARAMS = ("utm_", "ref", "aff", "fbclid", "gclid", "mc_", "_ga")
+
+
+# marks a listing page link standing in for a card without its own link
+PAGE_LINK_FRAGMENT = "event="
+
+
+# same event, same key: lower-case scheme/host, no fragment, no tracking
+# parameters, no trailing slash. Anything that isn't an http(s) URL (e.g. the
+# "N/A" placeholder) has no key, so it can't merge distinct events
+def canonical_link(url):
+    if not isinstance(url, str) or not url.strip():
+        return None
+    parts = urlsplit(url.strip())
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    path = parts.path.rstrip("/") or "/"
+    fragment = parts.fragment if parts.fragment.startswith(PAGE_LINK_FRAGMENT) else ""
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), fragment))
+
+
+# case, compatibility forms, punctuation and spacing don't make a different title
+def normalize_title(title):
+    if not isinstance(title, str):
+        return ""
+    title = unicodedata.normalize("NFKC", title).casefold()
+    return " ".join(re.sub(r"[\W_]+", " ", title).split())
+
+
+# link for a card that has none: the listing page it was on, keyed by the
+# card's normalized title so every event on the page keeps its own row; None
+# without a title (nothing would tell the events apart)
+def page_link(page_url, title):
+    if isinstance(title, str) and title.strip() in PLACEHOLDERS:
+        title = None
+    page, title = canonical_link(page_url), normalize_title(title)
+    if page is None or not title:
+        return None
+    # the query is dropped too, so the key doesn't change when the card moves to another page
+    return page.split("#")[0].split("?")[0] + "#" + PAGE_LINK_FRAGMENT + quote(title.replace(" ", "-"))
+
+
+def _clean(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, str) and value.strip() in PLACEHOLDERS:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+class HackathonStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        with self.connect() as db:
+            db.executescript(SCHEMA)
+
+    # one connection per call: commits on success, always closes
+    @contextmanager
+    def connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    # upserts the given columns of `df` (must include Link) by canonical link.
+    # NULLs and placeholders never overwrite a stored value, rows whose values
+    # didn't change are not written, and a changed RawDate marks the row for
+    # re-parsing. Rows without a usable link are skipped.
+    # -> {"inserted", "updated", "unchanged", "skipped"}
+    def upsert(self, df, columns=None):
+        columns = [c for c in (columns or df.columns) if c in COLUMNS and c not in ("Link", "UpdatedAt")]
+        links = df["Link"].map(canonical_link)
+        keep = links.notna()
+        skipped = int((~keep).sum())
+        rows = {}
+        for link, values in zip(links[keep], df.loc[keep, columns].itertuples(index=False, name=None)):
+            rows[link] = tuple(_clean(v) for v in values)  # later rows win
+        if not rows:
+            return {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": skipped}
+
+        names = ["Link"] + columns + ["UpdatedAt"]
+        sets = [f"{c} = COALESCE(excluded.{c}, hackathons.{c})" for c in columns]
+        changed = [f"COALESCE(excluded.{c}, hackathons.{c}) IS NOT hackathons.{c}" for c in columns]
+        if "RawDate" in columns and "Date" not in columns:
+            sets.append("DateParsed = CASE WHEN COALESCE(excluded.RawDate, hackathons.RawDate)"
+                        " IS NOT hackathons.RawDate THEN 0 ELSE hackathons.DateParsed END")
+        sets.append("UpdatedAt = excluded.UpdatedAt")
+        sql = (f"INSERT INTO hackathons ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+               f" ON CONFLICT(Link) DO UPDATE SET {', '.join(sets)}"
+               f" WHERE {' OR '.join(changed) or '0'}")
+        stamp = datetime.utcnow().isoformat()
+        with self.connect() as db:
+            existing = set()
+            keys = list(rows)
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                existing.update(r[0] for r in db.execute(
+                    f"SELECT Link FROM hackathons WHERE Link IN ({', '.join('?' * len(chunk))})", chunk))
+            before = db.total_changes
+            db.executemany(sql, [(link, *values, stamp) for link, values in rows.items()])
+            written = db.total_changes - before
+        inserted = len(rows) - len(existing)
+        return {"inserted": inserted, "updated": written - inserted, "unchanged": len(rows) - written,
+                "skipped": skipped}
+
+    # moves ScrapedAt forward for rows that were scraped again without changing;
+    # nothing else is written, so UpdatedAt still says when the row last changed
+    def touch(self, df):
+        rows = {}
+        for link, scraped in zip(df["Link"].map(canonical_link), df["ScrapedAt"]):
+            if link is not None and _clean(scraped) is not None:
+                rows[link] = _clean(scraped)
+        with self.connect() as db:
+            db.executemany("UPDATE hackathons SET ScrapedAt = ? WHERE Link = ?",
+                           [(scraped, link) for link, scraped in rows.items()])
+
+    # stores the parsed dates of rows whose RawDate has not been parsed yet;
+    # `parsed` has Link, StartDate, EndDate and DateConfidence columns
+    def set_dates(self, parsed):
+        stamp = datetime.utcnow().isoformat()
+        rows = parsed[["StartDate", "EndDate", "DateConfidence", "Link"]].itertuples(index=False, name=None)
+        with self.connect() as db:
+            db.executemany("UPDATE hackathons SET Date = ?, EndDate = ?, DateConfidence = ?, DateParsed = 1,"
+                           " UpdatedAt = ? WHERE Link = ?",
+                           [(_clean(start), _clean(end), float(conf), stamp, link) for start, end, conf, link in rows])
+
+    # replaces the near-duplicate clusters; `clusters` is a list of member lists
+    # of (source, link), canonical member first
+    def set_clusters(self, clusters):
+        with self.connect() as db:
+            db.execute("UPDATE hackathons SET DuplicateOf = NULL, SourceLinks = NULL"
+                       " WHERE DuplicateOf IS NOT NULL OR SourceLinks IS NOT NULL")
+            db.executemany("UPDATE hackathons SET SourceLinks = ? WHERE Link = ?",
+                           [(json.dumps(members), members[0][1]) for members in clusters])
+            db.executemany("UPDATE hackathons SET DuplicateOf = ? WHERE Link = ?",
+                           [(members[0][1], link) for members in clusters for _, link in members[1:]])
+
+    def query(self, sql, params=()):
+        with self.connect() as db:
+            return pd.read_sql_query(sql, db, params=params)
+
+    # rows with a parsed date, soonest first, one per event (near-duplicates are
+    # left out); optional filters use the indexes
+    def listings(self, columns=None, upcoming=False, sources=None, modes=None):
+        cols = ", ".join(columns or ["Title", "Date", "Location", "Mode", "Source", "Link", "Prize",
+                                     "Deadline", "ScrapedAt", "EndDate", "SourceLinks"])
+        where, params = ["Date IS NOT NULL", "DuplicateOf IS NULL"], []
+        if upcoming:
+            where.append("Date >= ?")
+            params.append(datetime.now().strftime("%Y-%m-%d"))
+        for col, values in (("Source", sources), ("Mode", modes)):
+            if values is not None:
+                values = list(values)
+                where.append(f"{col} IN ({', '.join('?' * len(values))})" if values else "0")
+                params.extend(values)
+        return self.query(f"SELECT {cols} FROM hackathons WHERE {' AND '.join(where)} ORDER BY Date", params)
+
+    def count(self):
+        with self.connect() as db:
+            return db.execute("SELECT COUNT(*) FROM hackathons").fetchone()[0]
+
+    # loads a finished CSV (e.g. the committed hackathons_final.csv) into an empty store
+    def seed_from_csv(self, path):
+        if self.count() or not os.path.exists(path):
+            return 0
+        df = pd.read_csv(path)
+        df["RawDate"] = df["Date"]
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        df["DateParsed"] = 1
+        return self.upsert(df)["inserted"]
+
+
+# Persistent dedupe index, kept in the same database: one row per record key, a
+# 64-bit hash of the canonical link (the store's key, so both count the same
+# records), with a hash of the record's content including its normalized title.
+# Each incoming batch is looked up by primary key, so the cost of a run depends
+# on the batch size, not on how many records have ever been seen.
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dedupe_links (
+    Key INTEGER PRIMARY KEY,
+    Content INTEGER NOT NULL,
+    Link TEXT,
+    FirstSeen TEXT,
+    LastSeen TEXT
+);
+"""
+
+
+def hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def record_key(link):
+    return hash64(canonical_link(link) or "")
+
+
+class DedupeIndex:
+    def __init__(self, store):
+        self.store = store
+        with store.connect() as db:
+            db.executescript(INDEX_SCHEMA)
+
+    # splits a batch against the index. Repeats of a link inside the batch
+    # collapse (the later row wins, as in upsert), rows without a link are
+    # dropped. Returns the rows that are new or whose title or `columns` changed,
+    # the counts, and the entries to pass to mark() once those rows are stored
+    def check(self, df, columns):
+        batch = {}
+        rows = df[["Title", "Link"] + columns].itertuples(index=False, name=None)
+        for pos, (title, link, *values) in enumerate(rows):
+            link = canonical_link(link)
+            if link is None:
+                continue
+            content = hash64("\x1f".join([normalize_title(title)] +
+                                          ["" if _clean(v) is None else str(_clean(v)) for v in values]))
+            batch[record_key(link)] = (pos, content, link)
+
+        known = {}
+        keys = list(batch)
+        with self.store.connect() as db:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                known.update(db.execute(
+                    f"SELECT Key, Content FROM dedupe_links WHERE Key IN ({', '.join('?' * len(chunk))})", chunk))
+
+        counts = {"new": 0, "updated": 0, "unchanged": 0, "repeated": len(df) - len(batch)}
+        changed = []
+        for key, (pos, content, _) in batch.items():
+            if key not in known:
+                counts["new"] += 1
+            elif known[key] != content:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            changed.append(pos)
+        entries = [(key, content, link) for key, (_, content, link) in batch.items()]
+        return df.iloc[sorted(changed)], counts, entries
+
+    # records the batch's keys and content hashes (LastSeen is refreshed for all)
+    def mark(self, entries):
+        stamp = datetime.utcnow().isoformat()
+        with self.store.connect() as db:
+            db.executemany("INSERT INTO dedupe_links (Key, Content, Link, FirstSeen, LastSeen) VALUES (?, ?, ?, ?, ?)"
+                           " ON CONFLICT(Key) DO UPDATE SET Content = excluded.Content, LastSeen = excluded.LastSeen",
+                           [(key, content, link, stamp, stamp) for key, content, link in entries])
+
+    def count(self):
+        with self.store.connect() as db:
+            return db.execute("SELECT COUNT(*) FROM dedupe_links").fetchone()[0]
+
+
+# casts an enriched frame to the snapshot types; Month keeps calendar order but
+# only the months that occur, so value_counts() matches the CSV path
+def snapshot_frame(df):
+    df = df.copy()
+    for col in SNAPSHOT_TIMESTAMPS:
+        if col in df:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+    for col in SNAPSHOT_CATEGORIES:
+        if col not in df:
+            continue
+        if col == "Month":
+            present = set(df[col].dropna())
+            df[col] = pd.Categorical(df[col], categories=[m for m in MONTHS if m in present], ordered=True)
+        else:
+            df[col] = df[col].astype("category")
+    if "Year" in df:
+        df["Year"] = df["Year"].astype("Int16")
+    if "DaysLeft" in df:
+        df["DaysLeft"] = df["DaysLeft"].astype("Int32")
+    return df
+
+
+# written next to the file and renamed into place so readers never see half a file
+def write_snapshot(df, path=SNAPSHOT_PATH):
+    tmp = path + ".tmp"
+    snapshot_frame(df).to_parquet(tmp, engine="pyarrow", index=False)
+    os.replace(tmp, path)
+    return path
+
+
+# reads only `columns` from the snapshot; None if no snapshot has been written
+def load_snapshot(columns=None, path=SNAPSHOT_PATH):
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path, engine="pyarrow", columns=columns)
@@ -0,0 +1,61 @@
+import ast
+import os
+import re
+import sys
+import types
+
+# Loads the definitions of the notebook export (hackathon_scraper.py) without
+# running the pipeline, for the tests and the benchmark runner. The export is
+# split on its "# In[..]:" markers; every cell before Cell 9 (which starts the
+# live scrape) is executed, with get_ipython() stubbed out. Of the later cells
+# named in `extra`, only the definitions run: imports, functions, classes and
+# UPPER_CASE settings, not the statements that do the pipeline's work.
+# Relative paths (scrape_state/, benchmarks/) resolve against the working
+# directory, as in the notebook.
+NOTEBOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hackathon_scraper.py")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CELL_MARK = re.compile(r"^# In\[[ \d]*\]:[ \t]*$", re.M)
+CELL_NAME = re.compile(r"^# Cell (\S+) - ", re.M)
+
+
+# -> [(cell name or None, source)], in notebook order
+def notebook_cells(path=NOTEBOOK):
+    with open(path, encoding="utf-8") as f:
+        src = f.read()
+    cells = []
+    for cell in CELL_MARK.split(src):
+        m = CELL_NAME.search(cell)
+        cells.append((m.group(1) if m else None, cell))
+    return cells
+
+
+def _is_definition(node):
+    if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return True
+    if isinstance(node, ast.Assign):
+        return all(isinstance(t, ast.Name) and t.id.isupper() for t in node.targets)
+    return False
+
+
+def _definitions(cell, filename):
+    tree = ast.parse(cell, filename)
+    tree.body = [node for node in tree.body if _is_definition(node)]
+    return compile(tree, filename, "exec")
+
+
+def load_notebook(upto="9", extra=(), path=NOTEBOOK):
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)  # hackathon_store.py
+    shell = types.SimpleNamespace(system=lambda *args, **kwargs: None)
+    ns = {"__name__": "hackathon_scraper", "__file__": path, "get_ipython": lambda: shell}
+    before = True
+    for name, cell in notebook_cells(path):
+        if name == upto:
+            before = False
+        filename = f"{path} [Cell {name}]"
+        if before:
+            exec(compile(cell, filename, "exec"), ns)
+        elif name in extra:
+            exec(_definitions(cell, filename), ns)
+    return ns
@@ -0,0 +1,61 @@
+import http.server
+import os
+import sys
+import threading
+import urllib.parse
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraper"))
+from notebook import load_notebook
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+# the notebook's definitions, loaded once in a scratch directory so scrape_state/
+# (page cache, breakers, checkpoints) never touches the working tree
+@pytest.fixture(scope="session")
+def nb(tmp_path_factory):
+    os.chdir(tmp_path_factory.mktemp("run"))
+    ns = load_notebook(extra=("9", "10", "10a", "10b", "10c"))
+    ns["CACHE_MODE"] = "off"
+    return ns
+
+
+class _FixtureHandler(http.server.BaseHTTPRequestHandler):
+    # /<slug>/?page=N -> fixtures/<slug>/pageN.html (page 1 without the param);
+    # any other path is a file under fixtures/
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        path = os.path.join(FIXTURES, parts.path.strip("/"))
+        if os.path.isdir(path):
+            page = urllib.parse.parse_qs(parts.query).get("page", ["1"])[0]
+            path = os.path.join(path, f"page{page}.html")
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+# base URL of a local server replaying the saved listing pages
+@pytest.fixture(scope="session")
+def fixture_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def read_fixture(*parts):
+    with open(os.path.join(FIXTURES, *parts), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,71 @@
+import pytest
+
+
+class _Driver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.fail:
+            raise self.error("unknown command: Network.setBlockedURLs")
+        self.calls.append(cmd)
+
+
+@pytest.fixture
+def driver_cls(nb):
+    _Driver.error = nb["WebDriverException"]
+    return _Driver
+
+
+def test_profile_is_sent_once_per_browser(nb, driver_cls):
+    driver = driver_cls()
+    assert nb["use_profile"](driver, "lean") == "lean"
+    assert nb["use_profile"](driver, "lean") == "lean"
+    assert driver.calls == ["Network.enable", "Network.setBlockedURLs"]
+
+
+def test_rejected_blocking_loads_unblocked(nb, driver_cls):
+    driver = driver_cls(fail=True)
+    assert nb["use_profile"](driver, "lean") == "full"
+    assert nb["use_profile"](driver, "lean") == "full"  # not retried on every page
+
+
+def _render_log(nb, monkeypatch, ready=True):
+    loads = []
+
+    def render(url, source, lease, profile, timeout=None):
+        loads.append(profile)
+        return [], {"selector": None, "profile": profile, "ready": ready}, None
+
+    monkeypatch.setitem(nb, "render_cards", render)
+    monkeypatch.setitem(nb["PROFILE_OVERRIDES"], "Test", "lean")
+    monkeypatch.setitem(nb, "demote_profile", lambda *a: None)
+    return loads
+
+
+def test_past_the_end_page_is_loaded_once(nb, monkeypatch):
+    loads = _render_log(nb, monkeypatch)
+    assert nb["fetch_cards_browser"]("http://x/?page=4", "Test", None)[0] == []
+    assert loads == ["lean"]
+
+
+def test_empty_first_page_retries_unblocked(nb, monkeypatch):
+    loads = _render_log(nb, monkeypatch)
+    nb["fetch_cards_browser"]("http://x/", "Test", None, expect_cards=True)
+    assert loads == ["lean", "full"]
+
+
+def test_page_that_never_got_ready_retries_unblocked(nb, monkeypatch):
+    loads = _render_log(nb, monkeypatch, ready=False)
+    nb["fetch_cards_browser"]("http://x/?page=4", "Test", None)
+    assert loads == ["lean", "full"]
+
+
+def test_only_anomalous_empty_pages_back_off(nb, monkeypatch):
+    _render_log(nb, monkeypatch)
+    reports = []
+    monkeypatch.setattr(nb["SCHEDULER"], "report", lambda source, status=None, empty=False, **kw: reports.append(empty))
+    nb["fetch_cards_browser"]("http://x/?page=4", "Test", None)
+    nb["fetch_cards_browser"]("http://x/", "Test", None, expect_cards=True)
+    assert reports == [False, True]
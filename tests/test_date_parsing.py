@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+TODAY = "2025-08-01"
+
+
+def _parse(nb, *texts):
+    return nb["parse_date_ranges"](pd.Series(texts, dtype=object), today=TODAY)
+
+
+@pytest.mark.parametrize("text, start, end", [
+    ("Sep 13 - 15, 2025", "2025-09-13", "2025-09-15"),
+    ("Jul 31 - Oct 01, 2025", "2025-07-31", "2025-10-01"),
+    ("Sat, Sep 13, 2025, 9:00 AM", "2025-09-13", "2025-09-13"),
+    ("30 Sep - 2 Oct 2025", "2025-09-30", "2025-10-02"),
+    ("Dec 30 - Jan 2, 2026", "2025-12-30", "2026-01-02"),
+    ("2025-09-13 - 2025-09-15", "2025-09-13", "2025-09-15"),
+    ("September 13th - 15th, 2025", "2025-09-13", "2025-09-15"),
+])
+def test_source_formats(nb, text, start, end):
+    row = _parse(nb, text).iloc[0]
+    assert (row["StartDate"], row["EndDate"]) == (pd.Timestamp(start), pd.Timestamp(end))
+
+
+@pytest.mark.parametrize("text", ["Marathon Hack 5", "Octopus Jam 12", "Mayhem 2 - 3", "See website"])
+def test_words_starting_like_months_are_not_dates(nb, text):
+    row = _parse(nb, text).iloc[0]
+    assert pd.isna(row["StartDate"]) and row["DateConfidence"] == 0.0
+
+
+@pytest.mark.parametrize("text, start, confidence", [
+    ("09/13/2025", "2025-09-13", 1.0),   # only month first works
+    ("13/09/2025", "2025-09-13", 1.0),   # only day first works
+    ("05/05/2025", "2025-05-05", 1.0),   # same date either way
+    ("03/04/2025", "2025-03-04", 0.5),   # could be 3 April or 4 March
+    ("03/04/2025 - 03/14/2025", "2025-03-04", 1.0),  # the end settles the order
+])
+def test_numeric_confidence(nb, text, start, confidence):
+    row = _parse(nb, text).iloc[0]
+    assert row["StartDate"] == pd.Timestamp(start)
+    assert row["DateConfidence"] == confidence
@@ -0,0 +1,51 @@
+import pandas as pd
+
+
+def _chunk(nb, *rows):
+    records = [nb["Hackathon"](source, title, date, "Online", link) for source, title, date, link in rows]
+    return nb["hackathons_to_frame"](records)
+
+
+def _run(nb, store, *rows):
+    return nb["store_chunks"]([_chunk(nb, *rows)], store, nb["DedupeIndex"](store))
+
+
+def test_counts_agree_with_the_store(nb, tmp_path):
+    store = nb["HackathonStore"](str(tmp_path / "hackathons.db"))
+    first = [("Devpost", "Open Climate Hack", "Sep 13 - 15, 2025", "https://climate.devpost.com/"),
+             ("MLH", "HackMIT", "SEP 13 - 15TH", "https://hackmit.org/")]
+
+    assert _run(nb, store, *first) == {"new": 2, "updated": 0, "unchanged": 0, "repeated": 0}
+    assert store.count() == 2
+    assert _run(nb, store, *first) == {"new": 0, "updated": 0, "unchanged": 2, "repeated": 0}
+
+
+def test_retitled_link_is_an_update_not_a_new_record(nb, tmp_path):
+    store = nb["HackathonStore"](str(tmp_path / "hackathons.db"))
+    link = "https://hackmit.org/"
+    _run(nb, store, ("MLH", "HackMIT", "SEP 13 - 15TH", link))
+
+    # same link twice in one batch, the second time under a new title: one store row
+    counts = _run(nb, store, ("MLH", "HACKMIT", "SEP 13 - 15TH", link),
+                  ("MLH", "HackMIT 2025", "SEP 13 - 15TH", link))
+
+    assert counts == {"new": 0, "updated": 1, "unchanged": 0, "repeated": 1}
+    assert store.query("SELECT Title FROM hackathons")["Title"].tolist() == ["HackMIT 2025"]
+
+
+def test_unchanged_rows_get_a_new_scraped_at_only(nb, tmp_path):
+    store = nb["HackathonStore"](str(tmp_path / "hackathons.db"))
+    index = nb["DedupeIndex"](store)
+    link = "https://hackmit.org/"
+
+    def scrape(stamp):
+        record = nb["Hackathon"]("MLH", "HackMIT", "SEP 13 - 15TH", "Online", link, ScrapedAt=stamp)
+        return nb["store_chunks"]([nb["hackathons_to_frame"]([record])], store, index)
+
+    scrape("2025-09-01T00:00:00")
+    updated = store.query("SELECT UpdatedAt FROM hackathons")["UpdatedAt"][0]
+    assert scrape("2025-09-02T00:00:00")["unchanged"] == 1
+
+    row = store.query("SELECT ScrapedAt, UpdatedAt FROM hackathons").iloc[0]
+    assert row["ScrapedAt"] == "2025-09-02T00:00:00"
+    assert row["UpdatedAt"] == updated
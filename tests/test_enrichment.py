@@ -0,0 +1,41 @@
+import pandas as pd
+
+from conftest import read_fixture
+
+
+def test_detail_page_fields(nb):
+    details = nb["extract_details"](read_fixture("details", "event.html"), "Hackathon.com",
+                                    "https://www.hackathon.com/event/open-climate-hack-2025")
+    assert details == {"Date": "2025-09-13 - 2025-09-15", "Location": "Online", "Prize": "$10,000 in prizes",
+                       "Deadline": "Sep 15, 2025"}
+
+
+def test_empty_detail_page_has_no_details(nb):
+    assert nb["extract_details"]("", "Devpost", "https://example.devpost.com/") == {}
+    assert nb["extract_details"]("\n  ", "Devpost", "https://example.devpost.com/") == {}
+
+
+def test_one_bad_page_keeps_the_batch(nb, fixture_server, tmp_path):
+    good, empty, missing = (fixture_server + "/details/" + name for name in ("event.html", "empty.html", "gone.html"))
+    rows = [("Hackathon.com", good), ("Hackathon.com", empty), ("Hackathon.com", missing)]
+
+    fetched = nb["fetch_details"](rows)
+
+    assert fetched[good]["Location"] == "Online"
+    assert fetched[empty] == {}
+    assert fetched[missing] == {}  # 404: remembered as gone
+
+    df = pd.DataFrame({"Link": [good, empty], "Source": "Hackathon.com", "Date": "N/A", "Location": "N/A",
+                       "Prize": None, "Deadline": None})
+    enriched = nb["enrich_listings"](df, path=str(tmp_path / "enriched.json"))
+    assert enriched["Location"].tolist() == ["Online", "N/A"]
+    assert enriched["EnrichedAt"].notna().all()
+
+
+def test_store_placeholders_are_filled_in(nb, fixture_server, tmp_path):
+    good = fixture_server + "/details/event.html"
+    df = pd.DataFrame({"Link": [good], "Source": "Hackathon.com", "Date": "NaT", "Location": "Unknown",
+                       "Prize": None, "Deadline": None})
+    enriched = nb["enrich_listings"](df, path=str(tmp_path / "enriched.json"))
+    assert enriched["Location"].tolist() == ["Online"]
+    assert enriched["Date"].tolist() == ["2025-09-13 - 2025-09-15"]
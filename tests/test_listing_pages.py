@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from conftest import read_fixture
+
+
+def test_extracts_hackathoncom_cards(nb):
+    cards, info = nb["extract_cards_from_html"](read_fixture("hackathoncom", "page1.html"), "Hackathon.com",
+                                                "https://www.hackathon.com/online")
+    assert info["selector"] == ".event-item"
+    assert [c["Title"] for c in cards] == ["Open Climate Hack 2025", "FinTech Sprint"]
+    assert cards[0]["Link"] == "https://www.hackathon.com/event/open-climate-hack-2025"
+    assert cards[1]["Date"] == "30 Sep - 2 Oct 2025"
+
+
+def test_missing_optional_fields_become_na(nb):
+    cards, _ = nb["extract_cards_from_html"](read_fixture("devpost", "page1.html"), "Devpost",
+                                             "https://devpost.com/hackathons")
+    assert [c["Title"] for c in cards] == ["TikTok TechJam 2025", "Linkless Hackathon"]
+    assert cards[0]["Location"] == "Online"
+    assert cards[1]["Link"] == "N/A"
+
+
+def test_mlh_card_text_is_collapsed(nb):
+    cards, _ = nb["extract_cards_from_html"](read_fixture("mlh", "page1.html"), "MLH", "https://mlh.io/seasons/2026/events")
+    assert cards == [{"Title": "HackMIT", "Date": "Sep 13th - 15th", "Location": "Cambridge, MA",
+                      "Link": "https://hackmit.org/"}]
+
+
+@pytest.mark.parametrize("body", ["", "   \n", "\x00\x00", "<?xml version='1.0' encoding='utf-8'?><a/>"])
+def test_unparseable_body_has_no_cards(nb, body):
+    assert nb["extract_cards_from_html"](body, "Hackathon.com", "https://www.hackathon.com/online") == \
+        ([], {"selector": None})
+
+
+def test_async_crawl_survives_empty_page(nb, fixture_server):
+    base = fixture_server + "/hackathoncom/"
+    pages = [(p, f"{base}?page={p}") for p in (1, 2, 3)]
+
+    async def crawl():
+        return [item async for item in nb["crawl_pages_async"](pages, "Hackathon.com")]
+
+    got = {page: len(cards) for page, _, cards, _ in asyncio.run(crawl())}
+    assert got == {1: 2, 2: 0, 3: 1}
+
+
+def test_pagination_stops_at_empty_page(nb, fixture_server, monkeypatch):
+    monkeypatch.setitem(nb["SOURCE_URLS"], "Hackathon.com", fixture_server + "/hackathoncom/")
+    # no Chrome here: the browser fallback for a page without static cards finds nothing too
+    monkeypatch.setitem(nb, "fetch_cards_browser", lambda *args, **kwargs: ([], {"selector": None}))
+    nb["start_run_guards"]()
+
+    records = list(nb["hackathoncom_scraper"](max_pages=3))
+
+    assert [r.Title for r in records] == ["Open Climate Hack 2025", "FinTech Sprint"]
+    assert records[1].Link.endswith("/event/fintech-sprint?utm_source=list")
+    assert nb["CHECKPOINTS"].next_page("Hackathon.com") is None
@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+
+def _listings(*rows):
+    return pd.DataFrame(rows, columns=["Source", "Title", "Date"])
+
+
+@pytest.mark.parametrize("a, b", [
+    ("HackMIT 2025", "HackMIT"),
+    ("HackMIT", "Hack MIT '25"),
+    ("TreeHacks 2nd Edition", "TreeHacks"),
+    ("Open Climate Hack", "open-climate hack!"),
+])
+def test_title_variants_are_merged(nb, a, b):
+    df = _listings(("MLH", a, "2025-09-13"), ("Devpost", b, "2025-09-14"))
+    assert [sorted(c) for c in nb["find_near_duplicates"](df)] == [[0, 1]]
+
+
+def test_different_events_stay_apart(nb):
+    df = _listings(("MLH", "HackMIT 2025", "2025-09-13"),
+                   ("Devpost", "HackMIT", "2024-09-14"),       # last year's edition
+                   ("Devpost", "HackNYU", "2025-09-13"),
+                   ("MLH", "HackMIT", "2025-09-14"))           # same source
+    assert nb["find_near_duplicates"](df) == []
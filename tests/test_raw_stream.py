@@ -0,0 +1,43 @@
+import json
+
+
+def _write_raw(path, rows, torn=""):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+        f.write(torn)
+
+
+def test_old_and_new_rows_share_one_schema(nb, tmp_path):
+    path = tmp_path / "raw.jsonl"
+    _write_raw(path, [
+        {"Source": "Devpost", "Title": "Open Climate Hack", "Date": "Sep 13 - 15, 2025", "Location": "Online",
+         "Link": "https://climate.devpost.com/", "ScrapedAt": "2025-08-01T00:00:00"},
+        {"Platform": "MLH", "Title": "HackMIT", "Date": "SEP 13 - 15TH", "Location": "Cambridge, MA",
+         "Link": "https://hackmit.org/", "ScrapedAt": "2025-08-01T00:00:00"},
+        {"Title": "Mystery Hack", "Date": "N/A", "Location": None, "Link": "https://mystery.example.org/"},
+    ], torn='{"Source": "MLH", "Tit')
+
+    chunks = list(nb["read_jsonl_chunks"](str(path)))
+
+    assert len(chunks) == 1
+    df = chunks[0]
+    assert list(df.columns) == list(nb["HACKATHON_FIELDS"])
+    assert df["Source"].tolist() == ["Devpost", "MLH", "Unknown"]
+    assert df["Mode"].tolist() == ["Online", "Offline", "Unknown"]
+    assert str(df["Source"].dtype) == "category"
+
+
+def test_raw_stream_lands_in_the_store(nb, tmp_path):
+    path = tmp_path / "raw.jsonl"
+    _write_raw(path, [
+        {"Platform": "Hackathon.com", "Title": "FinTech Sprint", "Date": "30 Sep - 2 Oct 2025",
+         "Location": "Online", "Link": "https://www.hackathon.com/event/fintech-sprint"},
+    ])
+    store = nb["HackathonStore"](str(tmp_path / "hackathons.db"))
+
+    nb["store_chunks"](nb["read_jsonl_chunks"](str(path)), store, nb["DedupeIndex"](store))
+
+    rows = store.query("SELECT Source, Title, RawDate, Mode FROM hackathons").to_dict("records")
+    assert rows == [{"Source": "Hackathon.com", "Title": "FinTech Sprint", "RawDate": "30 Sep - 2 Oct 2025",
+                     "Mode": "Online"}]
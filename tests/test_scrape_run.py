@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+def _records(nb, source, n, pause=0.0):
+    for k in range(n):
+        time.sleep(pause)
+        yield nb["Hackathon"](source, f"{source} event {k}", "N/A", "Online", f"https://example.org/{source}/{k}")
+
+
+def test_queued_sources_get_their_own_budget(nb, tmp_path, monkeypatch):
+    jobs = {name: (lambda name=name: _records(nb, name, 2, pause=0.1)) for name in ("A", "B", "C")}
+    for name in jobs:
+        monkeypatch.setitem(nb["SOURCE_BUDGETS"], name, 0.3)
+    with nb["JsonlSink"](str(tmp_path / "raw.jsonl")) as sink:
+        report = nb["run_scrapers_parallel"](jobs, sink, max_workers=1, grace=0.1, poll=0.05)
+    # one worker runs them back to back (~0.6s), longer than any single budget
+    assert {name: r["status"] for name, r in report.items()} == {"A": "ok", "B": "ok", "C": "ok"}
+    assert sink.written == 6
+
+
+def test_source_left_behind_does_not_trip_its_breaker(nb, tmp_path, monkeypatch):
+    release, finished = threading.Event(), threading.Event()
+
+    def stuck():
+        yield from _records(nb, "Stuck", 1)
+        release.wait(5)
+        try:
+            yield from _records(nb, "Stuck", 1)
+        finally:
+            finished.set()
+
+    jobs = {"Stuck": stuck, "Queued": lambda: _records(nb, "Queued", 1)}
+    for name in jobs:
+        monkeypatch.setitem(nb["SOURCE_BUDGETS"], name, 0.2)
+    with nb["JsonlSink"](str(tmp_path / "raw.jsonl")) as sink:
+        report = nb["run_scrapers_parallel"](jobs, sink, max_workers=1, grace=0.1, poll=0.05)
+    assert report["Stuck"]["status"] == "deadline"
+    assert report["Queued"]["status"] == "deadline"  # its only worker never came back
+
+    release.set()  # the left-behind thread resumes after its sink was closed
+    assert finished.wait(5)
+    time.sleep(0.1)
+    assert not nb["BREAKERS"].is_open("Stuck")
+    assert nb["BREAKERS"]._state.get("Stuck", {}).get("failures", 0) == 0
+
+
+def test_page_past_the_end_is_not_a_breaker_failure(nb, fixture_server, tmp_path, monkeypatch):
+    monkeypatch.setitem(nb["SOURCE_URLS"], "Hackathon.com", fixture_server + "/hackathoncom/")
+    monkeypatch.setitem(nb, "fetch_cards_browser", lambda *args, **kwargs: ([], {"selector": None}))
+    monkeypatch.setitem(nb, "BREAKERS", nb["CircuitBreakers"](str(tmp_path / "breakers.json")))
+    nb["start_run_guards"]()
+    assert len(list(nb["hackathoncom_scraper"](max_pages=3))) == 2
+    assert nb["BREAKERS"]._state["Hackathon.com"]["failures"] == 0
+
+
+def test_queue_jobs_go_through_the_source_guard(nb, tmp_path, monkeypatch):
+    fetched = []
+    monkeypatch.setitem(nb, "fetch_cards", lambda url, *a, **kw: fetched.append(url) or ([], {"selector": None}))
+    monkeypatch.setitem(nb["SOURCE_BUDGETS"], "Spent", 0)
+    queue = nb["SqliteWorkQueue"](str(tmp_path / "queue.db"))
+    queue.enqueue("Spent", [(1, "http://x/1"), (2, "http://x/2")])
+    nb["start_run_guards"]()
+    nb["queue_worker"](queue, "w", idle_sleep=0.01)
+    assert fetched == []
+    assert queue.stats() == {"Spent": {"skipped": 2}}